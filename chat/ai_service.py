@@ -7,13 +7,37 @@ Gemini API calls, with automatic logging to Logfire for observability.
 
 from pydantic_ai import Agent
 from pydantic_ai.exceptions import AgentRunError
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
 from pydantic_ai.models.google import GoogleModel
 from typing import Dict, List, Optional, Any, Tuple
 from django.contrib.auth.models import User
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import time so hot request paths don't re-resolve them.
+GEMINI_MODEL_NAME = 'gemini-2.5-flash-lite'
+
+# One gate for every outbound Gemini call: under load a burst queues on
+# the semaphore instead of stampeding the API into 429s, which would
+# re-serialize the requests anyway and inflate tail latency.
+GEMINI_SEMAPHORE = asyncio.Semaphore(32)
+
+_LANGUAGE_NAMES = {'en': 'English', 'es': 'Spanish', 'de': 'German'}
+
+# Static prefix of the after-action prompt; the per-message body is
+# joined onto it instead of growing a list on every request.
+_CONVERSATION_PROMPT_PREFIX = (
+    "Below is the full conversation in pairs of user text followed by "
+    "the grammar feedback they already received:\n\n"
+)
+
 from .analysis_models import (
     StructuredGrammarAnalysis,
     AdaptivePrompt,
@@ -28,7 +52,7 @@ class AIService:
 
     def __init__(self) -> None:
         """Initialize the AI service with Google Gemini model."""
-        self.model = GoogleModel('gemini-2.5-flash-lite')
+        self.model = GoogleModel(GEMINI_MODEL_NAME)
 
         # Agent for general chat responses
         self.chat_agent = Agent(
@@ -36,15 +60,46 @@ class AIService:
             system_prompt="You are a helpful AI assistant. Provide clear, concise responses.",
         )
 
+        # Agents only vary by language code(s), so cache them instead of
+        # rebuilding one per request; each agent keeps its HTTP client (and
+        # connection pool) alive across calls.
+        self._chat_agents: Dict[str, Agent] = {}
+        self._grammar_agents: Dict[Tuple[str, str], Agent] = {}
+        self._analysis_agents: Dict[Tuple[str, str], Agent] = {}
+
+    async def _run_agent(self, agent: Agent, *args: Any, **kwargs: Any) -> Any:
+        """Run an agent under the shared Gemini concurrency gate."""
+        async with GEMINI_SEMAPHORE:
+            return await agent.run(*args, **kwargs)
+
     def _get_language_name(self, language_code: str) -> str:
         """Convert language code to language name."""
-        language_map = {'en': 'English', 'es': 'Spanish', 'de': 'German'}
-        return language_map.get(language_code, 'English')
+        return _LANGUAGE_NAMES.get(language_code, 'English')
+
+    def _get_chat_agent(self, language_code: str) -> Agent:
+        """Return the cached chat agent for ``language_code``, creating it once."""
+        agent = self._chat_agents.get(language_code)
+        if agent is None:
+            language_name = self._get_language_name(language_code)
+            agent = Agent(
+                model=self.model,
+                system_prompt=(
+                    f"You are a helpful AI assistant. Respond in {language_name}. "
+                    "Provide clear, concise responses."
+                ),
+            )
+            self._chat_agents[language_code] = agent
+        return agent
 
     def _create_grammar_agent(
         self, language_code: str, grammar_analysis_language_code: str
     ) -> Agent:
-        """Create a grammar analysis agent for the specified language."""
+        """Return the grammar analysis agent for the language pair (cached)."""
+        cache_key = (language_code, grammar_analysis_language_code)
+        cached = self._grammar_agents.get(cache_key)
+        if cached is not None:
+            return cached
+
         language_name = self._get_language_name(language_code)
         grammar_analysis_language_name = self._get_language_name(
             grammar_analysis_language_code
@@ -57,12 +112,19 @@ class AIService:
             f"'No issues found' in {grammar_analysis_language_name}."
         )
 
-        return Agent(model=self.model, system_prompt=system_prompt)
+        agent = Agent(model=self.model, system_prompt=system_prompt)
+        self._grammar_agents[cache_key] = agent
+        return agent
 
     def _create_analysis_agent(
         self, analysis_language_code: str, target_language_code: str
     ) -> Agent:
-        """Create a conversation analysis agent for the specified languages."""
+        """Return the conversation analysis agent for the language pair (cached)."""
+        cache_key = (analysis_language_code, target_language_code)
+        cached = self._analysis_agents.get(cache_key)
+        if cached is not None:
+            return cached
+
         analysis_language_name = self._get_language_name(analysis_language_code)
         target_language_name = self._get_language_name(target_language_code)
 
@@ -74,7 +136,9 @@ class AIService:
             f"Respond using markdown bullet-points (with * or -) in {analysis_language_name}."
         )
 
-        return Agent(model=self.model, system_prompt=system_prompt)
+        agent = Agent(model=self.model, system_prompt=system_prompt)
+        self._analysis_agents[cache_key] = agent
+        return agent
 
     async def generate_chat_response(
         self,
@@ -97,27 +161,11 @@ class AIService:
         Raises:
             AgentRunError: If the AI model fails to respond
         """
-        language_name = self._get_language_name(language_code)
-
-        # Create a language-specific chat agent
-        chat_agent = Agent(
-            model=self.model,
-            system_prompt=(
-                f"You are a helpful AI assistant. Respond in {language_name}. "
-                "Provide clear, concise responses."
-            ),
-        )
+        chat_agent = self._get_chat_agent(language_code)
 
         # If we have conversation history, run with context
         if conversation_history:
             # Build message sequence for Pydantic AI
-            from pydantic_ai.messages import (
-                ModelRequest,
-                ModelResponse,
-                UserPromptPart,
-                TextPart,
-            )
-
             messages = []
             for msg in conversation_history:
                 if msg['role'] == 'user':
@@ -130,10 +178,12 @@ class AIService:
                     )
 
             # Run with conversation history and current message
-            result = await chat_agent.run(user_message, message_history=messages)
+            result = await self._run_agent(
+                chat_agent, user_message, message_history=messages
+            )
         else:
             # First message in conversation - no history
-            result = await chat_agent.run(user_message)
+            result = await self._run_agent(chat_agent, user_message)
 
         return str(result.output)
 
@@ -152,15 +202,17 @@ class AIService:
 
         Returns:
             Grammar analysis feedback
+
+        Raises:
+            AgentRunError: If the Gemini call fails. Callers decide how to
+                surface the failure; returning error text here would let it
+                be cached as if it were a real analysis.
         """
-        try:
-            grammar_agent = self._create_grammar_agent(
-                language_code, grammar_analysis_language_code
-            )
-            result = await grammar_agent.run(f'Text: """\n{text}\n"""')
-            return str(result.output)
-        except AgentRunError as e:
-            return f"Analysis failed: {e}"
+        grammar_agent = self._create_grammar_agent(
+            language_code, grammar_analysis_language_code
+        )
+        result = await self._run_agent(grammar_agent, f'Text: """\n{text}\n"""')
+        return str(result.output)
 
     async def analyze_conversation(
         self,
@@ -181,23 +233,17 @@ class AIService:
         """
         try:
             # Build the analysis prompt
-            prompt_parts = [
-                "Below is the full conversation in pairs of user text followed by "
-                "the grammar feedback they already received:\n\n"
-            ]
-
-            for msg_data in messages_data:
-                feedback = msg_data.get('feedback') or "No feedback available."
-                prompt_parts.append(
-                    f"User: {msg_data['message']}\nFeedback: {feedback}\n---\n"
-                )
-
-            prompt = "".join(prompt_parts)
+            prompt = _CONVERSATION_PROMPT_PREFIX + "".join(
+                f"User: {msg_data['message']}\n"
+                f"Feedback: {msg_data.get('feedback') or 'No feedback available.'}\n"
+                "---\n"
+                for msg_data in messages_data
+            )
 
             analysis_agent = self._create_analysis_agent(
                 analysis_language_code, target_language_code
             )
-            result = await analysis_agent.run(prompt)
+            result = await self._run_agent(analysis_agent, prompt)
             return str(result.output)
 
         except AgentRunError as e:
@@ -239,9 +285,10 @@ class AIService:
         )
 
         # Run structured analysis
-        result = await analysis_agent.run(
+        result = await self._run_agent(
+            analysis_agent,
             f"Analyze this {self._get_language_name(language_code)} text: \"{text}\"\n\n"
-            f"User's current level: {current_level}\n"
+            f"User's current level: {current_level}\n",
         )
 
         return result.output
@@ -302,13 +349,14 @@ class AIService:
             'session_context': session_context or {},
         }
 
-        result = await prompt_agent.run(
+        result = await self._run_agent(
+            prompt_agent,
             f"Generate an adaptive conversation prompt for a {language_profile.current_level} "
             f"{self._get_language_name(language_code)} learner.\n\n"
             f"Review concepts: {', '.join(context['review_concepts'][:5])}\n"
             f"New concepts: {', '.join(context['new_concepts'][:3])}\n"
             f"Weak areas: {', '.join(context['weak_areas'])}\n"
-            f"Learning goals: {', '.join(context['learning_goals'])}"
+            f"Learning goals: {', '.join(context['learning_goals'])}",
         )
 
         return result.output
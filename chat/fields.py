@@ -9,6 +9,22 @@ from django.db import models
 from django.core.exceptions import ValidationError
 from typing import Any, Optional, List
 import json
+import math
+
+
+def l2_normalize(vector: List[float]) -> List[float]:
+    """
+    Scale a vector to unit length.
+
+    Over unit-length vectors the pgvector inner-product operator (``<#>``)
+    ranks identically to cosine distance (``<=>``) but skips the per-row
+    norm computation, so embeddings are normalized once at write time and
+    queries use the cheaper operator.
+    """
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return [float(x) for x in vector]
+    return [float(x) / norm for x in vector]
 
 
 class VectorField(models.Field):
@@ -140,16 +156,21 @@ class VectorSearchMixin:
         Returns:
             QuerySet ordered by similarity (highest first)
         """
-        # Format query vector for pgvector
-        vector_str = '[' + ','.join(str(float(x)) for x in query_vector) + ']'
+        # Format query vector for pgvector; stored embeddings are unit-length,
+        # so -(a <#> b) over a normalized query equals cosine similarity.
+        vector_str = (
+            '[' + ','.join(str(float(x)) for x in l2_normalize(query_vector)) + ']'
+        )
 
+        # Defer the vector column: it's ~3 KB per row and result consumers
+        # only need the similarity score plus metadata fields.
         queryset = self.extra(
-            select={'similarity': f'1 - ({vector_field} <=> %s)'},
+            select={'similarity': f'-({vector_field} <#> %s)'},
             select_params=[vector_str],
-            where=[f'1 - ({vector_field} <=> %s) >= %s'],
+            where=[f'-({vector_field} <#> %s) >= %s'],
             params=[vector_str, threshold],
             order_by=['-similarity'],
-        )
+        ).defer(vector_field)
 
         return queryset[:limit]
 
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.17 on 2026-08-31 09:57
+
+import chat.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0011_increase_field_lengths'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GrammarAnalysisCache',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'prompt_hash',
+                    models.CharField(
+                        help_text='SHA-256 of the language pair and message text',
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                ('message_text', models.TextField(help_text='Original user message')),
+                (
+                    'language',
+                    models.CharField(
+                        choices=[
+                            ('en', 'English'),
+                            ('es', 'Spanish'),
+                            ('de', 'German'),
+                        ],
+                        default='en',
+                        help_text='Language the message was written in',
+                        max_length=2,
+                    ),
+                ),
+                (
+                    'analysis_language',
+                    models.CharField(
+                        choices=[
+                            ('en', 'English'),
+                            ('es', 'Spanish'),
+                            ('de', 'German'),
+                        ],
+                        default='en',
+                        help_text='Language the analysis feedback is written in',
+                        max_length=2,
+                    ),
+                ),
+                (
+                    'embedding',
+                    chat.fields.VectorField(
+                        blank=True,
+                        dimensions=768,
+                        help_text='Vector embedding of the message for similarity lookups',
+                        null=True,
+                    ),
+                ),
+                (
+                    'analysis',
+                    models.TextField(help_text='Cached grammar analysis text'),
+                ),
+                (
+                    'hits',
+                    models.IntegerField(
+                        default=0, help_text='How many times this entry has been reused'
+                    ),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Grammar Analysis Cache Entry',
+                'verbose_name_plural': 'Grammar Analysis Cache Entries',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Data migration: scale existing embeddings to unit length.
+#
+# Similarity queries now use the pgvector inner-product operator (<#>),
+# which only matches cosine ranking when every stored vector is
+# L2-normalized. New rows are normalized in Model.save(); this migration
+# brings rows written before the change in line.
+
+import math
+
+from django.db import migrations
+
+
+def _l2_normalize(vector):
+    norm = math.sqrt(sum(x * x for x in vector))
+    if norm == 0:
+        return vector
+    return [x / norm for x in vector]
+
+
+def normalize_embeddings(apps, schema_editor):
+    GrammarConcept = apps.get_model('chat', 'GrammarConcept')
+    GrammarAnalysisCache = apps.get_model('chat', 'GrammarAnalysisCache')
+
+    for model in (GrammarConcept, GrammarAnalysisCache):
+        for row in model.objects.exclude(embedding__isnull=True).iterator():
+            row.embedding = _l2_normalize(row.embedding)
+            row.save(update_fields=['embedding'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0012_grammaranalysiscache'),
+    ]
+
+    operations = [
+        # Normalization is idempotent, so reversing is a no-op.
+        migrations.RunPython(normalize_embeddings, migrations.RunPython.noop),
+    ]
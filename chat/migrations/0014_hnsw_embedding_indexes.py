@@ -0,0 +1,33 @@
+# HNSW indexes for the embedding columns.
+#
+# Similarity queries (clustering self-join, concept search, grammar cache
+# lookups) use the inner-product operator (<#>) over unit-length vectors;
+# vector_ip_ops lets pgvector answer them from the index instead of a
+# sequential scan. Raw SQL because VectorField is a custom field Django's
+# index classes don't understand.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0013_normalize_embeddings'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS chat_grammarconcept_embedding_hnsw "
+                "ON chat_grammarconcept USING hnsw (embedding vector_ip_ops)"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS chat_grammarconcept_embedding_hnsw",
+        ),
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS chat_grammaranalysiscache_embedding_hnsw "
+                "ON chat_grammaranalysiscache USING hnsw (embedding vector_ip_ops)"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS chat_grammaranalysiscache_embedding_hnsw",
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.17 on 2026-08-31 10:09
+
+import django.db.models.expressions
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0014_hnsw_embedding_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conceptmastery',
+            name='mastered',
+            field=models.GeneratedField(
+                db_index=True,
+                db_persist=True,
+                expression=models.ExpressionWrapper(
+                    models.Q(('attempts_count__gte', 5), ('mastery_score__gte', 0.8)),
+                    output_field=models.BooleanField(),
+                ),
+                help_text='Whether the concept counts as mastered (default threshold)',
+                output_field=models.BooleanField(),
+            ),
+        ),
+        migrations.AddField(
+            model_name='conceptmastery',
+            name='success_rate',
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=models.Case(
+                    models.When(attempts_count=0, then=models.Value(0.0)),
+                    default=django.db.models.expressions.CombinedExpression(
+                        django.db.models.expressions.CombinedExpression(
+                            models.F('correct_attempts'), '*', models.Value(100.0)
+                        ),
+                        '/',
+                        models.F('attempts_count'),
+                    ),
+                    output_field=models.FloatField(),
+                ),
+                help_text='Success rate percentage, maintained by the database',
+                output_field=models.FloatField(),
+            ),
+        ),
+    ]
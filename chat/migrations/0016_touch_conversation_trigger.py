@@ -0,0 +1,39 @@
+"""Maintain Conversation.updated_at from a Postgres trigger.
+
+Every ChatMessage insert should bump its conversation's ``updated_at``.
+Doing it in a trigger folds the timestamp update into the INSERT's
+round-trip, so ``send_message`` no longer issues a separate UPDATE, and
+messages created outside the view (shell, bulk loads) bump it too.
+"""
+
+from django.db import migrations
+
+CREATE_TRIGGER = """
+CREATE OR REPLACE FUNCTION chat_touch_conversation() RETURNS trigger AS $$
+BEGIN
+    UPDATE chat_conversation SET updated_at = NOW()
+    WHERE id = NEW.conversation_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER chat_chatmessage_touch_conversation
+AFTER INSERT ON chat_chatmessage
+FOR EACH ROW EXECUTE FUNCTION chat_touch_conversation();
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS chat_chatmessage_touch_conversation ON chat_chatmessage;
+DROP FUNCTION IF EXISTS chat_touch_conversation();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0015_conceptmastery_mastered_conceptmastery_success_rate'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_TRIGGER, reverse_sql=DROP_TRIGGER),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.17 on 2026-08-31 10:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0016_touch_conversation_trigger'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='conversation',
+            name='latest_report',
+            field=models.OneToOneField(
+                blank=True,
+                help_text='Most recently generated after-action report',
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name='+',
+                to='chat.afteractionreport',
+            ),
+        ),
+    ]
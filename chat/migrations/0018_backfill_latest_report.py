@@ -0,0 +1,37 @@
+"""Backfill Conversation.latest_report for pre-existing reports.
+
+New reports link themselves via AfterActionReport.save(); rows created
+before the denormalized pointer existed need a one-off backfill.
+"""
+
+from django.db import migrations
+
+
+def backfill_latest_report(apps, schema_editor):
+    """Point each conversation at its newest after-action report."""
+    Conversation = apps.get_model('chat', 'Conversation')
+    AfterActionReport = apps.get_model('chat', 'AfterActionReport')
+
+    for report in AfterActionReport.objects.order_by(
+        'conversation_id', '-created_at'
+    ).distinct('conversation_id'):
+        Conversation.objects.filter(pk=report.conversation_id).update(
+            latest_report=report
+        )
+
+
+def unlink_latest_report(apps, schema_editor):
+    """Reverse: clear the denormalized pointer."""
+    Conversation = apps.get_model('chat', 'Conversation')
+    Conversation.objects.update(latest_report=None)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0017_conversation_latest_report'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_latest_report, unlink_latest_report),
+    ]
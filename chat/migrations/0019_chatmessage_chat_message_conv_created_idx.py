@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-31 10:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0018_backfill_latest_report'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='chatmessage',
+            index=models.Index(
+                fields=['conversation', 'created_at'],
+                name='chat_message_conv_created_idx',
+            ),
+        ),
+    ]
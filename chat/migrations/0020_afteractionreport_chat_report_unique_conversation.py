@@ -0,0 +1,32 @@
+# Generated by Django 5.2.17 on 2026-08-31 10:41
+
+from django.db import migrations, models
+
+
+def delete_duplicate_reports(apps, schema_editor):
+    """Keep only the newest report per conversation before the constraint."""
+    AfterActionReport = apps.get_model('chat', 'AfterActionReport')
+
+    keep_ids = (
+        AfterActionReport.objects.order_by('conversation_id', '-created_at')
+        .distinct('conversation_id')
+        .values_list('id', flat=True)
+    )
+    AfterActionReport.objects.exclude(id__in=list(keep_ids)).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('chat', '0019_chatmessage_chat_message_conv_created_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicate_reports, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='afteractionreport',
+            constraint=models.UniqueConstraint(
+                fields=('conversation',), name='chat_report_unique_conversation'
+            ),
+        ),
+    ]
@@ -10,9 +10,16 @@ from django.db import models
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from dataclasses import dataclass
 from datetime import timedelta
-from typing import List
-from .fields import VectorField, VectorManager
+from typing import Any, List, Optional
+
+import hashlib
+
+import numpy as np
+from pgvector.django import MaxInnerProduct
+
+from .fields import VectorField, VectorManager, l2_normalize
 
 
 class Conversation(models.Model):
@@ -49,6 +56,17 @@ class Conversation(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Denormalized pointer maintained by AfterActionReport.save(): lets the
+    # analysis view join the report into its conversation fetch instead of
+    # issuing a separate reports query.
+    latest_report = models.OneToOneField(
+        'AfterActionReport',
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name='+',
+        help_text="Most recently generated after-action report",
+    )
 
     class Meta:
         """Django model metadata."""
@@ -150,6 +168,14 @@ class ChatMessage(models.Model):
 
         # Group by conversation, then chronological order within each.
         ordering = ["conversation_id", "created_at"]
+        # Backs the per-conversation history windows (ORDER BY created_at
+        # with a LIMIT) in the chat views.
+        indexes = [
+            models.Index(
+                fields=["conversation", "created_at"],
+                name="chat_message_conv_created_idx",
+            ),
+        ]
         verbose_name = "Chat Message"
         verbose_name_plural = "Chat Messages"
 
@@ -188,9 +214,22 @@ class AfterActionReport(models.Model):
         """Django model metadata."""
 
         ordering = ["-created_at"]
+        # One report per conversation: concurrent analysis requests race to
+        # insert, and the loser reuses the winner's row via get_or_create.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["conversation"],
+                name="chat_report_unique_conversation",
+            ),
+        ]
         verbose_name = "After-Action Report"
         verbose_name_plural = "After-Action Reports"
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save the report and point its conversation's latest_report at it."""
+        super().save(*args, **kwargs)
+        Conversation.objects.filter(pk=self.conversation_id).update(latest_report=self)
+
     def __str__(self) -> str:
         """Return the conversation title and date of the report."""
         friendly_date: str = self.created_at.strftime("%Y-%m-%d %H:%M")
@@ -244,6 +283,22 @@ class UserProfile(models.Model):
         return f"{self.user.username} Profile"
 
 
+@dataclass
+class ProgressionState:
+    """Aggregated mastery metrics used by LanguageProfile progression checks."""
+
+    recent_avg_mastery: Optional[float]
+    level_total_concepts: int
+    level_mastered_concepts: int
+
+    @property
+    def level_mastery_percentage(self) -> float:
+        """Share of current-level concepts the user has mastered."""
+        if self.level_total_concepts == 0:
+            return 1.0
+        return self.level_mastered_concepts / self.level_total_concepts
+
+
 class LanguageProfile(models.Model):
     """
     Language-specific learning profile for tracking progress per language.
@@ -355,38 +410,71 @@ class LanguageProfile(models.Model):
         }
         return level_scores.get(self.current_level, 0.1)
 
-    def update_proficiency_metrics(self) -> None:
-        """Update proficiency metrics based on recent performance (synchronous version)."""
-        # Calculate grammar accuracy from recent concept masteries
-        recent_masteries = self.user.concept_masteries.filter(
-            concept__language=self.target_language,
-            last_practiced__gte=timezone.now() - timedelta(days=30),
+    # Cached ProgressionState for this instance; reset whenever the profile
+    # is saved so the next check re-aggregates fresh mastery data.
+    _progression_cache: Optional[ProgressionState] = None
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Save the profile and invalidate the cached progression state."""
+        super().save(*args, **kwargs)
+        self._progression_cache = None
+
+    def _progression_aggregates(self) -> dict[str, Any]:
+        """Filtered aggregates shared by the sync and async progression paths.
+
+        Everything the progression checks need comes from one query over the
+        target language's concepts: the 30-day average mastery (grammar
+        accuracy) plus how many current-level concepts exist and how many of
+        them this user has mastered.
+        """
+        mine = models.Q(user_masteries__user=self.user)
+        recent = mine & models.Q(
+            user_masteries__last_practiced__gte=timezone.now() - timedelta(days=30)
         )
+        current_level = models.Q(cefr_level=self.current_level)
+        return {
+            'recent_avg_mastery': models.Avg(
+                'user_masteries__mastery_score', filter=recent
+            ),
+            'level_total_concepts': models.Count(
+                'id', filter=current_level, distinct=True
+            ),
+            'level_mastered_concepts': models.Count(
+                'user_masteries',
+                filter=current_level & mine & models.Q(user_masteries__mastered=True),
+                distinct=True,
+            ),
+        }
 
-        if recent_masteries.exists():
-            self.grammar_accuracy = (
-                recent_masteries.aggregate(avg_mastery=models.Avg('mastery_score'))[
-                    'avg_mastery'
-                ]
-                or 0.0
-            )
+    def compute_progression_state(self) -> ProgressionState:
+        """Compute (and cache) all progression metrics in a single query."""
+        if self._progression_cache is None:
+            agg = GrammarConcept.objects.filter(
+                language=self.target_language
+            ).aggregate(**self._progression_aggregates())
+            self._progression_cache = ProgressionState(**agg)
+        return self._progression_cache
+
+    async def acompute_progression_state(self) -> ProgressionState:
+        """Async version of compute_progression_state."""
+        if self._progression_cache is None:
+            agg = await GrammarConcept.objects.filter(
+                language=self.target_language
+            ).aaggregate(**self._progression_aggregates())
+            self._progression_cache = ProgressionState(**agg)
+        return self._progression_cache
+
+    def update_proficiency_metrics(self) -> None:
+        """Update proficiency metrics based on recent performance (synchronous version)."""
+        state = self.compute_progression_state()
+        if state.recent_avg_mastery is not None:
+            self.grammar_accuracy = state.recent_avg_mastery
 
     async def aupdate_proficiency_metrics(self) -> None:
         """Update proficiency metrics based on recent performance (async version)."""
-        # Calculate grammar accuracy from recent concept masteries
-        recent_masteries_count = await self.user.concept_masteries.filter(
-            concept__language=self.target_language,
-            last_practiced__gte=timezone.now() - timedelta(days=30),
-        ).acount()
-
-        if recent_masteries_count > 0:
-            # Use async aggregate to get average mastery score
-            avg_result = await self.user.concept_masteries.filter(
-                concept__language=self.target_language,
-                last_practiced__gte=timezone.now() - timedelta(days=30),
-            ).aaggregate(avg_mastery=models.Avg('mastery_score'))
-
-            self.grammar_accuracy = avg_result['avg_mastery'] or 0.0
+        state = await self.acompute_progression_state()
+        if state.recent_avg_mastery is not None:
+            self.grammar_accuracy = state.recent_avg_mastery
 
             # Update overall proficiency score based on multiple factors
             base_score = self.get_proficiency_score()
@@ -414,23 +502,12 @@ class LanguageProfile(models.Model):
             return False
 
         # Check if key concepts for current level are mastered
-        current_level_concepts = GrammarConcept.objects.filter(
-            language=self.target_language, cefr_level=self.current_level
-        )
-
-        mastered_concepts = 0
-        total_concepts = current_level_concepts.count()
+        state = self.compute_progression_state()
 
-        if total_concepts == 0:
+        if state.level_total_concepts == 0:
             return True  # No concepts defined for this level
 
-        for concept in current_level_concepts:
-            mastery = self.user.concept_masteries.filter(concept=concept).first()
-            if mastery and mastery.is_mastered():
-                mastered_concepts += 1
-
-        mastery_percentage = mastered_concepts / total_concepts
-        return mastery_percentage >= threshold
+        return state.level_mastery_percentage >= threshold
 
     def get_personalized_concepts_for_practice(
         self, limit: int = 5
@@ -576,6 +653,29 @@ class GrammarConcept(models.Model):
         """Set the embedding vector from a list of floats."""
         self.embedding = vector
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Normalize the embedding so inner-product search equals cosine."""
+        if self.embedding:
+            self.embedding = l2_normalize(self.embedding)
+        super().save(*args, **kwargs)
+
+    def _similar_queryset(self, threshold: float) -> models.QuerySet['GrammarConcept']:
+        """
+        Other concepts annotated with cosine similarity, best first.
+
+        The distance math runs inside pgvector (C with SIMD, served by the
+        HNSW index); embeddings are unit-length, so the negated inner
+        product equals cosine similarity. The embedding column itself is
+        deferred — it is 3 KB per row and callers only read metadata.
+        """
+        return (
+            GrammarConcept.objects.exclude(id=self.id)
+            .annotate(similarity=-MaxInnerProduct('embedding', self.embedding))
+            .filter(similarity__gte=threshold)
+            .order_by('-similarity')
+            .defer('embedding')
+        )
+
     def find_similar_concepts(
         self, limit: int = 5, threshold: float = 0.5
     ) -> models.QuerySet['GrammarConcept']:
@@ -583,19 +683,7 @@ class GrammarConcept(models.Model):
         if not self.embedding:
             return GrammarConcept.objects.none()
 
-        # Get similarity results and exclude self, then limit
-        similar_queryset = GrammarConcept.objects.extra(
-            select={'similarity': '1 - (embedding <=> %s)'},
-            select_params=['[' + ','.join(str(float(x)) for x in self.embedding) + ']'],
-            where=['1 - (embedding <=> %s) >= %s'],
-            params=[
-                '[' + ','.join(str(float(x)) for x in self.embedding) + ']',
-                threshold,
-            ],
-            order_by=['-similarity'],
-        ).exclude(id=self.id)[:limit]
-
-        return similar_queryset
+        return self._similar_queryset(threshold)[:limit]
 
     def find_prerequisites_by_similarity(
         self, threshold: float = 0.7
@@ -614,24 +702,9 @@ class GrammarConcept(models.Model):
         if not lower_levels:
             return GrammarConcept.objects.none()
 
-        return (
-            GrammarConcept.objects.filter(
-                language=self.language, cefr_level__in=lower_levels
-            )
-            .exclude(id=self.id)
-            .extra(
-                select={'similarity': '1 - (embedding <=> %s)'},
-                select_params=[
-                    '[' + ','.join(str(float(x)) for x in self.embedding) + ']'
-                ],
-                where=['1 - (embedding <=> %s) >= %s'],
-                params=[
-                    '[' + ','.join(str(float(x)) for x in self.embedding) + ']',
-                    threshold,
-                ],
-                order_by=['-similarity'],
-            )[:10]
-        )
+        return self._similar_queryset(threshold).filter(
+            language=self.language, cefr_level__in=lower_levels
+        )[:10]
 
     def find_learning_path(self, limit: int = 5) -> List['GrammarConcept']:
         """Find a suggested learning path based on concept similarity and CEFR progression."""
@@ -647,52 +720,22 @@ class GrammarConcept(models.Model):
         learning_path = []
 
         # Look for similar concepts at the same level first
-        same_level_base = (
-            GrammarConcept.objects.filter(
+        same_level = list(
+            self._similar_queryset(0.6).filter(
                 language=self.language, cefr_level=self.cefr_level
-            )
-            .exclude(id=self.id)
-            .extra(
-                select={'similarity': '1 - (embedding <=> %s)'},
-                select_params=[
-                    '[' + ','.join(str(float(x)) for x in self.embedding) + ']'
-                ],
-                where=['1 - (embedding <=> %s) >= %s'],
-                params=[
-                    '[' + ','.join(str(float(x)) for x in self.embedding) + ']',
-                    0.6,
-                ],
-                order_by=['-similarity'],
             )[:2]
         )
 
-        same_level = list(same_level_base)
-
         learning_path.extend(same_level)
 
         # Then look at next levels
         next_levels = cefr_order[current_index + 1 : current_index + 3]  # Next 2 levels
         if next_levels:
-            next_concepts_base = (
-                GrammarConcept.objects.filter(
+            next_concepts = list(
+                self._similar_queryset(0.5).filter(
                     language=self.language, cefr_level__in=next_levels
-                )
-                .exclude(id=self.id)
-                .extra(
-                    select={'similarity': '1 - (embedding <=> %s)'},
-                    select_params=[
-                        '[' + ','.join(str(float(x)) for x in self.embedding) + ']'
-                    ],
-                    where=['1 - (embedding <=> %s) >= %s'],
-                    params=[
-                        '[' + ','.join(str(float(x)) for x in self.embedding) + ']',
-                        0.5,
-                    ],
-                    order_by=['-similarity'],
                 )[:3]
             )
-
-            next_concepts = list(next_concepts_base)
             learning_path.extend(next_concepts)
 
         return learning_path[:limit]
@@ -756,6 +799,31 @@ class ConceptMastery(models.Model):
     performance_history = models.JSONField(
         default=list, help_text="History of performance scores over time"
     )
+    # Denormalized copies of get_success_rate() / is_mastered() so list
+    # queries and dashboards can sort and filter on them without calling
+    # Python per row. Generated columns: Postgres keeps them in sync.
+    success_rate = models.GeneratedField(
+        expression=models.Case(
+            models.When(attempts_count=0, then=models.Value(0.0)),
+            default=models.F('correct_attempts')
+            * models.Value(100.0)
+            / models.F('attempts_count'),
+            output_field=models.FloatField(),
+        ),
+        output_field=models.FloatField(),
+        db_persist=True,
+        help_text="Success rate percentage, maintained by the database",
+    )
+    mastered = models.GeneratedField(
+        expression=models.ExpressionWrapper(
+            models.Q(mastery_score__gte=0.8, attempts_count__gte=5),
+            output_field=models.BooleanField(),
+        ),
+        output_field=models.BooleanField(),
+        db_persist=True,
+        db_index=True,
+        help_text="Whether the concept counts as mastered (default threshold)",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -834,6 +902,109 @@ class ConceptMastery(models.Model):
         if len(self.performance_history) > 100:
             self.performance_history = self.performance_history[-100:]
 
+    @classmethod
+    def bulk_update_performance(
+        cls, user: User, updates: List[tuple[int, bool, float]]
+    ) -> List['ConceptMastery']:
+        """
+        Apply update_performance math to many masteries at once.
+
+        Grading a whole conversation touches one mastery per concept; doing
+        that through update_performance costs a SELECT and an UPDATE per
+        row. This path loads the batch with one query, runs the SM-2 math
+        as NumPy array operations, and persists with a single bulk_update.
+        The scalar method stays for single-concept calls.
+
+        Args:
+            user: User whose masteries are being graded
+            updates: (concept_id, is_correct, difficulty) per graded concept
+
+        Returns:
+            The updated ConceptMastery rows (already persisted)
+        """
+        if not updates:
+            return []
+
+        graded = {
+            concept_id: (is_correct, difficulty)
+            for concept_id, is_correct, difficulty in updates
+        }
+        masteries = list(cls.objects.filter(user=user, concept_id__in=graded))
+        if not masteries:
+            return []
+
+        now = timezone.now()
+        is_correct = np.array([graded[m.concept_id][0] for m in masteries], dtype=bool)
+        difficulty = np.array(
+            [graded[m.concept_id][1] for m in masteries], dtype=np.float64
+        )
+        attempts = np.array([m.attempts_count for m in masteries]) + 1
+        correct = np.array([m.correct_attempts for m in masteries]) + is_correct
+        ease = np.array([m.ease_factor for m in masteries], dtype=np.float64)
+        interval = np.array([m.repetition_interval for m in masteries])
+
+        # Ease factor: same branches as update_performance (easy/hard bands
+        # are disjoint, failures get the flat penalty).
+        ease = np.where(
+            is_correct & (difficulty < 0.3), np.minimum(4.0, ease + 0.1), ease
+        )
+        ease = np.where(
+            is_correct & (difficulty > 0.7), np.maximum(1.3, ease - 0.15), ease
+        )
+        ease = np.where(~is_correct, np.maximum(1.3, ease - 0.2), ease)
+
+        # Interval: 1 -> 6 on first success, multiply by ease after, reset
+        # to 1 on failure. astype truncates like int() in the scalar path.
+        interval = np.where(
+            is_correct,
+            np.where(interval == 1, 6, (interval * ease).astype(np.int64)),
+            1,
+        )
+
+        success_rate = correct / attempts * 100.0
+        mastery_score = (success_rate / 100.0) * np.minimum(1.0, attempts / 10.0)
+
+        for i, mastery in enumerate(masteries):
+            mastery.attempts_count = int(attempts[i])
+            mastery.correct_attempts = int(correct[i])
+            mastery.ease_factor = float(ease[i])
+            mastery.repetition_interval = int(interval[i])
+            mastery.mastery_score = float(mastery_score[i])
+            mastery.last_practiced = now
+            if is_correct[i]:
+                mastery.last_seen_correct = now
+            mastery.next_review = now + timedelta(days=int(interval[i]))
+
+            mastery.performance_history.append(
+                {
+                    'timestamp': now.isoformat(),
+                    'correct': bool(is_correct[i]),
+                    'difficulty': float(difficulty[i]),
+                    'mastery_score': float(mastery_score[i]),
+                    'success_rate': float(success_rate[i]),
+                }
+            )
+            if len(mastery.performance_history) > 100:
+                mastery.performance_history = mastery.performance_history[-100:]
+
+        cls.objects.bulk_update(
+            masteries,
+            [
+                'attempts_count',
+                'correct_attempts',
+                'ease_factor',
+                'repetition_interval',
+                'mastery_score',
+                'last_practiced',
+                'last_seen_correct',
+                'next_review',
+                'performance_history',
+            ],
+            batch_size=100,
+        )
+
+        return masteries
+
     def needs_review(self) -> bool:
         """Check if this concept is due for review."""
         if not self.next_review:
@@ -942,3 +1113,71 @@ class ErrorPattern(models.Model):
     def is_persistent(self, threshold: int = 3) -> bool:
         """Check if error occurs frequently enough to be considered persistent."""
         return self.frequency >= threshold and not self.is_resolved
+
+
+class GrammarAnalysisCache(models.Model):
+    """
+    Semantic cache of grammar analysis results.
+
+    Learners send many near-identical messages ("Hello", "How are you?", ...),
+    so repeated Gemini calls for the same analysis are wasted. Byte-identical
+    prompts are found via ``prompt_hash`` without touching the embedding;
+    paraphrases are found via pgvector cosine similarity on ``embedding``.
+    """
+
+    prompt_hash = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the language pair and message text",
+    )
+    message_text = models.TextField(help_text="Original user message")
+    language = models.CharField(
+        max_length=2,
+        choices=Conversation.LANGUAGE_CHOICES,
+        default='en',
+        help_text="Language the message was written in",
+    )
+    analysis_language = models.CharField(
+        max_length=2,
+        choices=Conversation.LANGUAGE_CHOICES,
+        default='en',
+        help_text="Language the analysis feedback is written in",
+    )
+    embedding = VectorField(
+        dimensions=768,
+        null=True,
+        blank=True,
+        help_text="Vector embedding of the message for similarity lookups",
+    )
+    analysis = models.TextField(help_text="Cached grammar analysis text")
+    hits = models.IntegerField(
+        default=0, help_text="How many times this entry has been reused"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = VectorManager()
+
+    class Meta:
+        verbose_name = "Grammar Analysis Cache Entry"
+        verbose_name_plural = "Grammar Analysis Cache Entries"
+        ordering = ['-created_at']
+
+    def __str__(self) -> str:
+        return (
+            f"Cache[{self.language}->{self.analysis_language}] "
+            f"{self.message_text[:40]!r} ({self.hits} hits)"
+        )
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Normalize the embedding so inner-product search equals cosine."""
+        if self.embedding:
+            self.embedding = l2_normalize(self.embedding)
+        super().save(*args, **kwargs)
+
+    @staticmethod
+    def make_prompt_hash(
+        message: str, analysis_language: str, language_code: str
+    ) -> str:
+        """Hash a message plus its language pair for the exact-match fast path."""
+        key = f"{language_code}:{analysis_language}:{message}"
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
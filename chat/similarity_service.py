@@ -8,6 +8,7 @@ including hybrid search, concept clustering, and personalized recommendations.
 import logging
 from typing import List, Dict, Any, Optional
 from datetime import timedelta
+from django.db import connection
 from django.db.models import QuerySet, Q, Avg, Count
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -310,44 +311,64 @@ class ConceptSimilarityService:
         """
         Group concepts into clusters based on vector similarity.
 
-        Uses a simple clustering approach based on similarity thresholds.
+        A single pgvector self-join fetches every similar pair in one
+        indexed scan (instead of one similarity query per concept), and a
+        small union-find merges the pairs into connected components.
         """
-        clusters = {}
-        processed_ids = set()
+        # Filter and defer in SQL: rows without embeddings can't cluster,
+        # and the 3 KB embedding column itself is never read here.
+        concepts_list = list(
+            concepts.filter(embedding__isnull=False).defer('embedding')
+        )
+        if not concepts_list:
+            return {}
+
+        by_id = {c.id: c for c in concepts_list}
+        ids = list(by_id)
+
+        # All edges above the threshold in one round-trip. Embeddings are
+        # unit-length (normalized at save), so -(a <#> b) is cosine similarity.
+        table = GrammarConcept._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT a.id, b.id FROM {table} a "
+                f"JOIN {table} b ON a.id < b.id "
+                f"WHERE a.id = ANY(%s) AND b.id = ANY(%s) "
+                f"AND -(a.embedding <#> b.embedding) >= %s",
+                [ids, ids, similarity_threshold],
+            )
+            edges = cursor.fetchall()
 
-        # Convert QuerySet to list to avoid slicing issues
-        concepts_list = list(concepts)
-        concept_ids = {c.id for c in concepts_list}
+        # Union-find over concept ids
+        parent = {concept_id: concept_id for concept_id in ids}
 
-        for concept in concepts_list:
-            if concept.id in processed_ids or not concept.embedding:
-                continue
+        def find(concept_id: int) -> int:
+            while parent[concept_id] != concept_id:
+                parent[concept_id] = parent[parent[concept_id]]  # Path halving
+                concept_id = parent[concept_id]
+            return concept_id
 
-            # Find similar concepts and filter to only include ones from our input set
-            similar_concepts_qs = concept.find_similar_concepts(
-                limit=10, threshold=similarity_threshold
-            )
+        for a, b in edges:
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                parent[root_b] = root_a
 
-            # Filter to only concepts in our input set
-            similar_concepts = [
-                c
-                for c in similar_concepts_qs
-                if c.id in concept_ids and c.id not in processed_ids
-            ]
+        components: Dict[int, List[GrammarConcept]] = {}
+        for concept_id in ids:
+            components.setdefault(find(concept_id), []).append(by_id[concept_id])
 
-            cluster_concepts = [concept]
-            cluster_concepts.extend(similar_concepts)
-
-            if len(cluster_concepts) >= min_cluster_size:
-                cluster_name = (
-                    f"cluster_{concept.cefr_level}_"
-                    f"{concept.name.lower().replace(' ', '_')}"
-                )
-                clusters[cluster_name] = cluster_concepts
+        clusters = {}
+        for members in components.values():
+            if len(members) < min_cluster_size:
+                continue
 
-                # Mark as processed
-                for c in cluster_concepts:
-                    processed_ids.add(c.id)
+            # Name the cluster after its first concept, matching the old
+            # seed-based naming scheme.
+            seed = members[0]
+            cluster_name = (
+                f"cluster_{seed.cefr_level}_" f"{seed.name.lower().replace(' ', '_')}"
+            )
+            clusters[cluster_name] = members
 
         return clusters
 
@@ -5,10 +5,16 @@ These tests cover all async views and use mocked Agent methods to avoid
 external API calls during testing.
 """
 
-import json
-from typing import Any
+import re
+from contextlib import contextmanager
+from datetime import timedelta
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Iterator
 from unittest.mock import AsyncMock, patch, MagicMock
-from django.test import TestCase, TransactionTestCase, Client
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.sessions.backends.db import SessionStore
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase
 from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
 from django.test.utils import override_settings
@@ -16,36 +22,217 @@ from django.contrib.auth.backends import ModelBackend
 from django.contrib.auth import login as auth_login
 from django.urls import reverse
 from django.utils import timezone
-from asgiref.sync import sync_to_async
 from django.test.client import AsyncClient
 
-from .models import ChatMessage, Conversation, AfterActionReport
+from .models import (
+    ChatMessage,
+    Conversation,
+    AfterActionReport,
+    GrammarAnalysisCache,
+)
 from .ai_service import ai_service
+from .views import CONVERSATION_STARTERS, _drain_grammar_tasks
 
+# One precompiled alternation per language: a single regex pass over the
+# rendered page instead of one substring scan per starter. Byte patterns
+# run directly against response.content without decoding the body.
+_STARTER_PATTERNS = {
+    lang: re.compile('|'.join(re.escape(s) for s in starters).encode())
+    for lang, starters in CONVERSATION_STARTERS.items()
+}
 
-class AsyncChatViewsTest(TransactionTestCase):
+# Frozenset views of the starters for O(1) membership assertions
+_STARTER_SETS = {
+    lang: frozenset(starters) for lang, starters in CONVERSATION_STARTERS.items()
+}
+
+# The URLconf is fixed for the test process, so resolve the hot
+# no-argument URLs once at import instead of per call.
+SEND_MESSAGE_URL = reverse('send_message')
+NEW_CONVERSATION_URL = reverse('new_conversation')
+LANGUAGE_SELECTION_URL = reverse('language_selection')
+DEMO_SEND_MESSAGE_URL = reverse('demo_send_message')
+DEMO_CLEAR_CONVERSATION_URL = reverse('demo_clear_conversation')
+
+
+# Hash the shared test password once at import; per-test user rows can then
+# be created with the cached hash instead of re-running the password hasher.
+_TEST_PASSWORD_HASH = make_password('testpass123')
+
+# Canonical JsonResponse bodies for fixed error payloads. Comparing raw
+# bytes skips the JSON parse in assertions.
+ERR_EMPTY_MESSAGE = b'{"error": "Message cannot be empty"}'
+ERR_MISSING_CONVERSATION_ID = b'{"error": "Conversation ID is required"}'
+ERR_INVALID_CONVERSATION_ID = b'{"error": "Invalid conversation ID"}'
+
+# Canonical multi-turn exchanges shared by the memory tests; built once so
+# each test just references (or extends) the same expected-history shape.
+_HELLO_HISTORY = [
+    {'role': 'user', 'content': 'Hi there!'},
+    {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
+]
+_HELLO_NAME_HISTORY = _HELLO_HISTORY + [
+    {'role': 'user', 'content': 'What is your name?'},
+    {'role': 'assistant', 'content': 'My name is Claude.'},
+]
+
+
+@contextmanager
+def swap_ai_service(replacement: MagicMock) -> Iterator[MagicMock]:
+    """Swap ``chat.views.ai_service`` for ``replacement`` via direct assignment.
+
+    Plain attribute swapping skips the patch.start/stop bookkeeping that
+    ``mock.patch`` performs on every test entry and exit.
+    """
+    from chat import views
+
+    original = views.ai_service
+    views.ai_service = replacement
+    try:
+        yield replacement
+    finally:
+        views.ai_service = original
+
+
+def _async_return(value: Any) -> Callable[..., Awaitable[Any]]:
+    """Return a plain coroutine function that always returns ``value``.
+
+    A bare ``async def`` stub avoids AsyncMock's attribute-tracking and
+    call-recording machinery when a test only needs a canned return value.
+    """
+
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        return value
+
+    return _stub
+
+
+def _async_raise(exception: Exception) -> Callable[..., Awaitable[Any]]:
+    """Return a plain coroutine function that always raises ``exception``."""
+
+    async def _stub(*args: Any, **kwargs: Any) -> Any:
+        raise exception
+
+    return _stub
+
+
+# Shared stateless grammar stub for the many tests that never inspect the
+# analyze_grammar call itself; built once instead of an AsyncMock per test.
+_NO_ISSUES_ANALYSIS = _async_return("No issues found.")
+
+# One shared AsyncClient for the whole module: the handler and middleware
+# chain are built once instead of per test. Tests reset the cookie jar in
+# setUp so no session state leaks between them.
+_SHARED_ASYNC_CLIENT = AsyncClient()
+
+
+def _make_agent(output: str) -> AsyncMock:
+    """Build the stubbed Agent graph ``agent.run(...) -> result.output``.
+
+    One factory instead of hand-assembling the same three-object AsyncMock
+    tree at each call site; the result object is a plain MagicMock since
+    only its ``output`` attribute is read.
+    """
+    agent = AsyncMock()
+    result = MagicMock()
+    result.output = output
+    agent.run.return_value = result
+    return agent
+
+
+@dataclass
+class AsyncRecorder:
+    """Minimal awaitable callable that records its calls.
+
+    Stands in for AsyncMock in tests that need call-argument assertions
+    without the rest of the mock machinery.
+    """
+
+    return_value: Any = None
+    calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = field(default_factory=list)
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+def _populate_auth_session(session: SessionStore, user: User) -> None:
+    """Fill ``session`` with the keys Django's auth middleware expects."""
+    session['_auth_user_id'] = str(user.pk)
+    session['_auth_user_backend'] = 'django.contrib.auth.backends.ModelBackend'
+    session['_auth_user_hash'] = user.get_session_auth_hash()
+
+
+def _create_session_for(user: User) -> str:
+    """Build a logged-in database session for ``user`` and return its key.
+
+    Writing the session row directly lets async tests authenticate by setting
+    the session cookie on the client instead of calling ``force_login``
+    through ``sync_to_async`` on every test.
+    """
+    session = SessionStore()
+    _populate_auth_session(session, user)
+    session.save()
+    return str(session.session_key)
+
+
+async def _acreate_session_for(user: User) -> str:
+    """Async variant of ``_create_session_for`` for use inside async tests.
+
+    Saves the session through the async session API, so no sync_to_async
+    thread hop (and no force_login user re-fetch) is needed.
+    """
+    session = SessionStore()
+    _populate_auth_session(session, user)
+    await session.asave()
+    return str(session.session_key)
+
+
+async def _conversation_from_redirect(response: Any) -> Conversation:
+    """Fetch the conversation a new-conversation redirect points at.
+
+    Parses the pk out of the Location header and looks it up with a
+    primary-key ``aget`` — a single index probe, and unambiguous even once
+    the user owns more than one conversation.
+    """
+    conversation_id = int(response.url.rstrip('/').rsplit('/', 1)[-1])
+    return await Conversation.objects.aget(pk=conversation_id)
+
+
+class AsyncChatViewsTest(TestCase):
     """Test async chat views with mocked AI service."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = AsyncClient()
+    user: User
+    conversation: Conversation
 
-    async def asetUp(self) -> None:
-        """Set up async test data."""
-        self.user = await User.objects.acreate_user(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the shared user and conversation once for the whole class."""
+        cls.user = User.objects.create_user(
             username='testuser', password='testpass123', email='test@example.com'
         )
-
-        self.conversation = await Conversation.objects.acreate(
-            user=self.user, title='Test Conversation'
+        cls.conversation = Conversation.objects.create(
+            user=cls.user, title='Test Conversation'
         )
+        cls.session_key = _create_session_for(cls.user)
+
+    def setUp(self) -> None:
+        """Point self.client at the shared client with a clean cookie jar."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
+
+    def login_test_user(self) -> None:
+        """Authenticate the client by attaching the pre-built session cookie.
+
+        Avoids the sync_to_async(force_login) thread hop on every test.
+        """
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
 
     async def test_new_conversation_authenticated(self) -> None:
         """Test creating a new conversation when authenticated."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
-        response = await self.client.get(reverse('new_conversation'))
+        response = await self.client.get(NEW_CONVERSATION_URL)
 
         self.assertEqual(response.status_code, 302)
         # Should redirect to a chat view with the new conversation ID
@@ -53,16 +240,14 @@ class AsyncChatViewsTest(TransactionTestCase):
 
     async def test_new_conversation_redirects_unauthenticated(self) -> None:
         """Test new conversation redirects to login when not authenticated."""
-        await self.asetUp()
-        response = await self.client.get(reverse('new_conversation'))
+        response = await self.client.get(NEW_CONVERSATION_URL)
 
         self.assertEqual(response.status_code, 302)
         self.assertIn('login', response.url)
 
     async def test_chat_view_authenticated(self) -> None:
         """Test chat view loads correctly for authenticated user."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         response = await self.client.get(
             reverse('chat', kwargs={'conversation_id': self.conversation.id})
@@ -74,11 +259,12 @@ class AsyncChatViewsTest(TransactionTestCase):
 
     async def test_chat_view_wrong_user(self) -> None:
         """Test chat view returns 404 for wrong user."""
-        await self.asetUp()
         other_user = await User.objects.acreate_user(
             username='otheruser', password='testpass123'
         )
-        await sync_to_async(self.client.force_login)(other_user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            other_user
+        )
 
         response = await self.client.get(
             reverse('chat', kwargs={'conversation_id': self.conversation.id})
@@ -86,30 +272,30 @@ class AsyncChatViewsTest(TransactionTestCase):
 
         self.assertEqual(response.status_code, 404)
 
-    @patch('chat.views.ai_service')
-    async def test_send_message_success(self, mock_ai_service: MagicMock) -> None:
+    async def test_send_message_success(self) -> None:
         """Test sending a message successfully with mocked AI service."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         # Mock the AI service methods
-        mock_ai_service.generate_chat_response = AsyncMock(
+        mock_ai_service = MagicMock()
+        mock_ai_service.generate_chat_response = AsyncRecorder(
             return_value="This is a test response from AI"
         )
-        mock_ai_service.analyze_grammar = AsyncMock(
-            return_value="No grammar issues found."
-        )
+        mock_ai_service.analyze_grammar = _async_return("No grammar issues found.")
 
-        response = await self.client.post(
-            reverse('send_message'),
-            {
-                'message': 'Hello, how are you?',
-                'conversation_id': str(self.conversation.id),
-            },
-        )
+        with swap_ai_service(mock_ai_service):
+            response = await self.client.post(
+                SEND_MESSAGE_URL,
+                {
+                    'message': 'Hello, how are you?',
+                    'conversation_id': str(self.conversation.id),
+                },
+            )
+            # Finish the detached grammar task while the mock is in place
+            await _drain_grammar_tasks()
 
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
+        response_data = response.json()
 
         self.assertEqual(response_data['message'], 'Hello, how are you?')
         self.assertEqual(response_data['response'], 'This is a test response from AI')
@@ -117,10 +303,10 @@ class AsyncChatViewsTest(TransactionTestCase):
         self.assertIn('message_id', response_data)
 
         # Verify the AI service was called with conversation language and history
-        mock_ai_service.generate_chat_response.assert_called_once_with(
-            'Hello, how are you?',
-            'en',
-            [],  # default language, empty history for first message
+        self.assertEqual(
+            mock_ai_service.generate_chat_response.calls,
+            [(('Hello, how are you?', 'en', []), {})],
+            # default language, empty history for first message
         )
 
         # Verify the message was saved
@@ -129,72 +315,76 @@ class AsyncChatViewsTest(TransactionTestCase):
         ).acount()
         self.assertEqual(message_count, 1)
 
-    async def test_send_message_empty_message(self) -> None:
-        """Test sending an empty message returns error."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
-
-        response = await self.client.post(
-            reverse('send_message'),
-            {'message': '', 'conversation_id': str(self.conversation.id)},
-        )
-
-        self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.content)
-        self.assertIn('error', response_data)
-        self.assertEqual(response_data['error'], 'Message cannot be empty')
-
-    async def test_send_message_missing_conversation_id(self) -> None:
-        """Test sending a message without conversation ID returns error."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
-
-        response = await self.client.post(reverse('send_message'), {'message': 'Hello'})
-
-        self.assertEqual(response.status_code, 400)
-        response_data = json.loads(response.content)
-        self.assertIn('error', response_data)
-        self.assertEqual(response_data['error'], 'Conversation ID is required')
-
-    async def test_send_message_get_request(self) -> None:
-        """Test GET request to send_message returns method not allowed."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+    async def test_send_message_error_paths(self) -> None:
+        """Table-driven checks for send_message error responses.
+
+        Covers the empty-message, missing-conversation-id and wrong-method
+        paths with one login and one client instead of three separate tests.
+        """
+        self.login_test_user()
+
+        cases = [
+            (
+                'empty message',
+                'post',
+                {'message': '', 'conversation_id': str(self.conversation.id)},
+                400,
+                ERR_EMPTY_MESSAGE,
+            ),
+            (
+                'missing conversation id',
+                'post',
+                {'message': 'Hello'},
+                400,
+                ERR_MISSING_CONVERSATION_ID,
+            ),
+            (
+                'malformed conversation id',
+                'post',
+                {'message': 'Hello', 'conversation_id': 'abc'},
+                400,
+                ERR_INVALID_CONVERSATION_ID,
+            ),
+            ('get request', 'get', None, 405, None),
+        ]
 
-        response = await self.client.get(reverse('send_message'))
+        for label, method, payload, expected_status, expected_body in cases:
+            with self.subTest(label):
+                if method == 'post':
+                    response = await self.client.post(SEND_MESSAGE_URL, payload)
+                else:
+                    response = await self.client.get(SEND_MESSAGE_URL)
 
-        self.assertEqual(response.status_code, 405)
-        response_data = json.loads(response.content)
-        self.assertIn('error', response_data)
+                self.assertEqual(response.status_code, expected_status)
+                if expected_body is not None:
+                    self.assertEqual(response.content, expected_body)
+                else:
+                    self.assertIn('error', response.json())
 
-    @patch('chat.views.ai_service')
-    async def test_send_message_ai_error(self, mock_ai_service: MagicMock) -> None:
+    async def test_send_message_ai_error(self) -> None:
         """Test handling AI service errors during message sending."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         # Mock AI service to raise an exception
-        mock_ai_service.generate_chat_response = AsyncMock(
-            side_effect=Exception("AI service error")
+        mock_ai_service = MagicMock()
+        mock_ai_service.generate_chat_response = _async_raise(
+            Exception("AI service error")
         )
 
-        response = await self.client.post(
-            reverse('send_message'),
-            {
-                'message': 'Hello, how are you?',
-                'conversation_id': str(self.conversation.id),
-            },
-        )
+        with swap_ai_service(mock_ai_service):
+            response = await self.client.post(
+                SEND_MESSAGE_URL,
+                {
+                    'message': 'Hello, how are you?',
+                    'conversation_id': str(self.conversation.id),
+                },
+            )
 
-        self.assertEqual(response.status_code, 500)
-        response_data = json.loads(response.content)
-        self.assertIn('error', response_data)
-        self.assertIn('AI service error', response_data['error'])
+        self.assertContains(response, 'AI service error', status_code=500)
 
     async def test_check_grammar_status_no_analysis(self) -> None:
         """Test checking grammar status when no analysis exists yet."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         message = await ChatMessage.objects.acreate(
             conversation=self.conversation,
@@ -207,13 +397,11 @@ class AsyncChatViewsTest(TransactionTestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
-        self.assertEqual(response_data['grammar_analysis'], '')
+        self.assertJSONEqual(response.content, {'grammar_analysis': ''})
 
     async def test_check_grammar_status_with_analysis(self) -> None:
         """Test checking grammar status when analysis exists."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         message = await ChatMessage.objects.acreate(
             conversation=self.conversation,
@@ -227,13 +415,11 @@ class AsyncChatViewsTest(TransactionTestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
-        self.assertEqual(response_data['grammar_analysis'], 'No issues found.')
+        self.assertJSONEqual(response.content, {'grammar_analysis': 'No issues found.'})
 
     async def test_check_grammar_status_post_request(self) -> None:
         """Test POST request to check_grammar_status returns method not allowed."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         message = await ChatMessage.objects.acreate(
             conversation=self.conversation,
@@ -249,8 +435,7 @@ class AsyncChatViewsTest(TransactionTestCase):
 
     async def test_conversation_analysis_no_messages(self) -> None:
         """Test conversation analysis redirects when no messages exist."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         response = await self.client.get(
             reverse(
@@ -262,13 +447,10 @@ class AsyncChatViewsTest(TransactionTestCase):
         self.assertEqual(response.status_code, 302)
         self.assertIn('/conversation/', response.url)
 
-    @patch('chat.views.ai_service')
-    async def test_conversation_analysis_success(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_conversation_analysis_success(self) -> None:
         """Test successful conversation analysis with mocked AI service."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        mock_ai_service = MagicMock()
+        self.login_test_user()
 
         # Create some test messages
         await ChatMessage.objects.acreate(
@@ -290,21 +472,22 @@ class AsyncChatViewsTest(TransactionTestCase):
             "* Areas for improvement: None identified\n"
             "* Recommendations: Continue practicing daily conversations"
         )
-        mock_ai_service.analyze_conversation = AsyncMock(return_value=mock_analysis)
+        mock_ai_service.analyze_conversation = AsyncRecorder(return_value=mock_analysis)
 
-        response = await self.client.get(
-            reverse(
-                'conversation_analysis',
-                kwargs={'conversation_id': self.conversation.id},
+        with swap_ai_service(mock_ai_service):
+            response = await self.client.get(
+                reverse(
+                    'conversation_analysis',
+                    kwargs={'conversation_id': self.conversation.id},
+                )
             )
-        )
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Clear communication")
-        self.assertContains(response, "Continue practicing")
+        # Assert on the template context instead of scanning the rendered body
+        self.assertEqual(response.context['analysis'], mock_analysis)
 
         # Verify the AI service was called
-        mock_ai_service.analyze_conversation.assert_called_once()
+        self.assertEqual(len(mock_ai_service.analyze_conversation.calls), 1)
 
         # Verify the report was saved
         report_count = await AfterActionReport.objects.filter(
@@ -314,8 +497,7 @@ class AsyncChatViewsTest(TransactionTestCase):
 
     async def test_conversation_analysis_existing_report(self) -> None:
         """Test conversation analysis reuses existing report."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.login_test_user()
 
         # Create a test message
         await ChatMessage.objects.acreate(
@@ -338,15 +520,12 @@ class AsyncChatViewsTest(TransactionTestCase):
         )
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, existing_analysis)
+        self.assertEqual(response.context['analysis'], existing_analysis)
 
-    @patch('chat.views.ai_service')
-    async def test_conversation_analysis_ai_error(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_conversation_analysis_ai_error(self) -> None:
         """Test conversation analysis handles AI service errors."""
-        await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        mock_ai_service = MagicMock()
+        self.login_test_user()
 
         # Create a test message
         await ChatMessage.objects.acreate(
@@ -356,27 +535,29 @@ class AsyncChatViewsTest(TransactionTestCase):
         )
 
         # Mock AI service to raise an exception
-        mock_ai_service.analyze_conversation = AsyncMock(
-            return_value="⚠️ Failed to generate analysis: AI service error"
+        mock_ai_service.analyze_conversation = _async_return(
+            "⚠️ Failed to generate analysis: AI service error"
         )
 
-        response = await self.client.get(
-            reverse(
-                'conversation_analysis',
-                kwargs={'conversation_id': self.conversation.id},
+        with swap_ai_service(mock_ai_service):
+            response = await self.client.get(
+                reverse(
+                    'conversation_analysis',
+                    kwargs={'conversation_id': self.conversation.id},
+                )
             )
-        )
 
         self.assertEqual(response.status_code, 200)
-        self.assertContains(response, "Failed to generate analysis")
+        self.assertIn("Failed to generate analysis", response.context['analysis'])
 
     async def test_conversation_analysis_wrong_user(self) -> None:
         """Test conversation analysis returns 404 for wrong user."""
-        await self.asetUp()
         other_user = await User.objects.acreate_user(
             username='otheruser', password='testpass123'
         )
-        await sync_to_async(self.client.force_login)(other_user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            other_user
+        )
 
         # Create a test message for the original user's conversation
         await ChatMessage.objects.acreate(
@@ -395,12 +576,13 @@ class AsyncChatViewsTest(TransactionTestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class AsyncGrammarAnalysisTest(TransactionTestCase):
+class AsyncGrammarAnalysisTest(TestCase):
     """Test async grammar analysis functionality."""
 
     def setUp(self) -> None:
-        """Set up test data."""
-        pass
+        """Point self.client at the shared client with a clean cookie jar."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
 
     async def asetUp(self) -> None:
         """Set up async test data."""
@@ -473,12 +655,12 @@ class AsyncGrammarAnalysisTest(TransactionTestCase):
     async def test_send_message_with_grammar_analysis_completion(
         self, mock_ai_service: MagicMock
     ) -> None:
-        """Test that grammar analysis completes when sending a message via asyncio.gather."""
-        from django.test.client import AsyncClient
-
+        """Test that the detached grammar analysis task completes after sending a message."""
         await self.asetUp()
-        client = AsyncClient()
-        await sync_to_async(client.force_login)(self.user)
+        client = self.client
+        client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
         # Mock the AI service methods
         mock_ai_service.generate_chat_response = AsyncMock(
             return_value="This is a test response from AI"
@@ -494,7 +676,7 @@ class AsyncGrammarAnalysisTest(TransactionTestCase):
 
         # Send a message
         response = await client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Hello, can you help me with my grammer?',
                 'conversation_id': str(self.conversation.id),
@@ -503,8 +685,10 @@ class AsyncGrammarAnalysisTest(TransactionTestCase):
 
         # Verify the response is successful
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
-        message_id = response_data['message_id']
+        message_id = response.json()['message_id']
+
+        # Grammar analysis runs detached from the request; wait for it
+        await _drain_grammar_tasks()
 
         # Verify that the message was created
         message = await ChatMessage.objects.aget(id=message_id)
@@ -523,105 +707,181 @@ class AsyncGrammarAnalysisTest(TransactionTestCase):
         )
 
 
-class AIServiceTest(TransactionTestCase):
-    """Test AI service functionality with mocked agents."""
+class GrammarAnalysisCacheTest(TestCase):
+    """Test the exact-hash grammar analysis cache.
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        pass
+    The semantic (embedding) layer is disabled in test settings, so these
+    tests exercise the hash fast path that is always active in production.
+    """
 
-    @patch('chat.ai_service.Agent')
-    async def test_generate_chat_response(self, MockAgent: MagicMock) -> None:
-        """Test chat response generation with mocked agent."""
-        mock_agent_instance = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.output = "Mocked AI response"
-        mock_agent_instance.run.return_value = mock_result
-        MockAgent.return_value = mock_agent_instance
+    @patch('chat.views.ai_service')
+    async def test_exact_hash_hit_skips_ai_call(
+        self, mock_ai_service: MagicMock
+    ) -> None:
+        """A byte-identical repeat is served from the cache, not Gemini."""
+        from chat.views import _run_grammar_analysis
 
-        # Create a fresh AI service instance for testing
-        from chat.ai_service import AIService
+        mock_ai_service.analyze_grammar = AsyncMock(return_value="Looks good.")
 
-        service = AIService()
-        service.chat_agent = mock_agent_instance
+        first = await _run_grammar_analysis("Hello there!", 'en', 'en')
+        second = await _run_grammar_analysis("Hello there!", 'en', 'en')
 
-        result = await service.generate_chat_response("Hello", "en")
+        self.assertEqual(first, "Looks good.")
+        self.assertEqual(second, "Looks good.")
+        mock_ai_service.analyze_grammar.assert_called_once()
 
-        self.assertEqual(result, "Mocked AI response")
-        mock_agent_instance.run.assert_called_once_with("Hello")
+        entry = await GrammarAnalysisCache.objects.aget()
+        self.assertEqual(entry.analysis, "Looks good.")
+        self.assertEqual(entry.hits, 1)
 
-    @patch('chat.ai_service.Agent')
-    async def test_analyze_grammar(self, MockAgent: MagicMock) -> None:
-        """Test grammar analysis with mocked agent."""
-        mock_agent_instance = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.output = "Grammar looks good!"
-        mock_agent_instance.run.return_value = mock_result
-        MockAgent.return_value = mock_agent_instance
+    @patch('chat.views.ai_service')
+    async def test_different_messages_miss(self, mock_ai_service: MagicMock) -> None:
+        """Distinct messages get distinct entries and separate AI calls."""
+        from chat.views import _run_grammar_analysis
 
-        # Create a fresh AI service instance for testing
-        from chat.ai_service import AIService
+        mock_ai_service.analyze_grammar = AsyncMock(
+            side_effect=["First analysis.", "Second analysis."]
+        )
 
-        service = AIService()
+        self.assertEqual(
+            await _run_grammar_analysis("Hello there!", 'en', 'en'),
+            "First analysis.",
+        )
+        self.assertEqual(
+            await _run_grammar_analysis("Goodbye now!", 'en', 'en'),
+            "Second analysis.",
+        )
+
+        self.assertEqual(mock_ai_service.analyze_grammar.call_count, 2)
+        self.assertEqual(await GrammarAnalysisCache.objects.acount(), 2)
+
+    @patch('chat.views.ai_service')
+    async def test_expired_entry_is_refreshed(self, mock_ai_service: MagicMock) -> None:
+        """Entries older than the TTL are misses and overwritten in place."""
+        from chat.views import _run_grammar_analysis
+
+        mock_ai_service.analyze_grammar = AsyncMock(
+            side_effect=["Old analysis.", "Fresh analysis."]
+        )
+
+        await _run_grammar_analysis("Hello there!", 'en', 'en')
+        stale = timezone.now() - timedelta(days=2)
+        await GrammarAnalysisCache.objects.aupdate(created_at=stale)
+
+        result = await _run_grammar_analysis("Hello there!", 'en', 'en')
+
+        self.assertEqual(result, "Fresh analysis.")
+        self.assertEqual(mock_ai_service.analyze_grammar.call_count, 2)
+        entry = await GrammarAnalysisCache.objects.aget()
+        self.assertEqual(entry.analysis, "Fresh analysis.")
+        self.assertEqual(entry.hits, 0)
+        self.assertGreater(entry.created_at, stale)
 
-        result = await service.analyze_grammar("This is a test.", "en")
+    @patch('chat.views.ai_service')
+    async def test_failed_analysis_is_not_cached(
+        self, mock_ai_service: MagicMock
+    ) -> None:
+        """A failed AI call stores nothing, so the next attempt retries."""
+        from chat.views import _grammar_analysis_or_error
 
-        self.assertEqual(result, "Grammar looks good!")
-        mock_agent_instance.run.assert_called_once_with(
-            'Text: """\nThis is a test.\n"""'
+        mock_ai_service.analyze_grammar = AsyncMock(
+            side_effect=[Exception("AI service unavailable"), "Real analysis."]
         )
 
+        failed = await _grammar_analysis_or_error("Hello there!", 'en', 'en')
+        self.assertIn("AI service unavailable", failed)
+        self.assertEqual(await GrammarAnalysisCache.objects.acount(), 0)
+
+        # The failure was not cached, so the retry reaches Gemini and its
+        # real analysis is what gets stored.
+        recovered = await _grammar_analysis_or_error("Hello there!", 'en', 'en')
+        self.assertEqual(recovered, "Real analysis.")
+        entry = await GrammarAnalysisCache.objects.aget()
+        self.assertEqual(entry.analysis, "Real analysis.")
+
+
+class AIServiceTest(TestCase):
+    """Test AI service functionality with mocked agents."""
+
+    def setUp(self) -> None:
+        """Set up test data."""
+        pass
+
     @patch('chat.ai_service.Agent')
-    async def test_analyze_conversation(self, MockAgent: MagicMock) -> None:
-        """Test conversation analysis with mocked agent."""
-        mock_agent_instance = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.output = "Overall analysis complete"
-        mock_agent_instance.run.return_value = mock_result
+    async def test_service_methods(self, MockAgent: MagicMock) -> None:
+        """Parameterized checks for the three AI service methods.
+
+        One patched Agent and one AIService instance are shared across the
+        cases instead of rebuilding both for each method under test.
+        """
+        mock_agent_instance = _make_agent("")
         MockAgent.return_value = mock_agent_instance
 
-        # Create a fresh AI service instance for testing
+        # Create one AI service instance shared by all cases
         from chat.ai_service import AIService
 
         service = AIService()
+        service.chat_agent = mock_agent_instance
 
         messages_data = [
             {'message': 'Hello', 'feedback': 'Good greeting'},
             {'message': 'How are you?', 'feedback': 'Correct grammar'},
         ]
 
-        result = await service.analyze_conversation(messages_data, "en")
+        # (label, coroutine factory, agent output, expected prompt)
+        # The expected prompt is matched exactly when given as a string and
+        # as substrings when given as a list.
+        cases: list[tuple[str, Callable[[], Awaitable[str]], str, Any]] = [
+            (
+                'generate_chat_response',
+                lambda: service.generate_chat_response("Hello", "en"),
+                "Mocked AI response",
+                "Hello",
+            ),
+            (
+                'analyze_grammar',
+                lambda: service.analyze_grammar("This is a test.", "en"),
+                "Grammar looks good!",
+                'Text: """\nThis is a test.\n"""',
+            ),
+            (
+                'analyze_conversation',
+                lambda: service.analyze_conversation(messages_data, "en"),
+                "Overall analysis complete",
+                ["Hello", "Good greeting"],
+            ),
+        ]
 
-        self.assertEqual(result, "Overall analysis complete")
-        mock_agent_instance.run.assert_called_once()
-        call_args = mock_agent_instance.run.call_args[0][0]
-        self.assertIn("Hello", call_args)
-        self.assertIn("Good greeting", call_args)
+        for label, call, output, expected_prompt in cases:
+            with self.subTest(label):
+                mock_agent_instance.run.reset_mock()
+                mock_agent_instance.run.return_value.output = output
 
+                result = await call()
 
-class ConversationStarterTestCase(TestCase):
-    """Test cases for the conversation starter feature."""
+                self.assertEqual(result, output)
+                mock_agent_instance.run.assert_called_once()
+                prompt = mock_agent_instance.run.call_args[0][0]
+                if isinstance(expected_prompt, list):
+                    for fragment in expected_prompt:
+                        self.assertIn(fragment, prompt)
+                else:
+                    self.assertEqual(prompt, expected_prompt)
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', email='test@example.com', password='testpass123'
-        )
-        self.client.login(username='testuser', password='testpass123')
+
+class ConversationStartersStaticTest(SimpleTestCase):
+    """Pure-Python checks on the starter data; no database needed."""
 
     def test_conversation_starters_dict_exists(self) -> None:
         """Test that CONVERSATION_STARTERS dict is defined and not empty."""
-        from .views import CONVERSATION_STARTERS
-
         self.assertIsInstance(CONVERSATION_STARTERS, dict)
         self.assertGreater(len(CONVERSATION_STARTERS), 0)
 
-        # Check that all languages have lists of starters
+        # Check that all languages have tuples of starters
         expected_languages = ['en', 'es', 'de']
         for lang in expected_languages:
             self.assertIn(lang, CONVERSATION_STARTERS)
-            self.assertIsInstance(CONVERSATION_STARTERS[lang], list)
+            self.assertIsInstance(CONVERSATION_STARTERS[lang], tuple)
             self.assertGreater(len(CONVERSATION_STARTERS[lang]), 0)
 
             # Check that all starters are strings
@@ -631,8 +891,6 @@ class ConversationStarterTestCase(TestCase):
 
     def test_conversation_starters_content(self) -> None:
         """Test that conversation starters contain expected prompts."""
-        from .views import CONVERSATION_STARTERS
-
         # Test English starters
         expected_en_starters = [
             "Tell me about your family?",
@@ -641,7 +899,7 @@ class ConversationStarterTestCase(TestCase):
             "What did you do this weekend?",
         ]
         for expected in expected_en_starters:
-            self.assertIn(expected, CONVERSATION_STARTERS['en'])
+            self.assertIn(expected, _STARTER_SETS['en'])
 
         # Test Spanish starters
         expected_es_starters = [
@@ -649,7 +907,7 @@ class ConversationStarterTestCase(TestCase):
             "¿Qué hiciste hoy?",
         ]
         for expected in expected_es_starters:
-            self.assertIn(expected, CONVERSATION_STARTERS['es'])
+            self.assertIn(expected, _STARTER_SETS['es'])
 
         # Test German starters
         expected_de_starters = [
@@ -657,52 +915,71 @@ class ConversationStarterTestCase(TestCase):
             "Was hast du heute gemacht?",
         ]
         for expected in expected_de_starters:
-            self.assertIn(expected, CONVERSATION_STARTERS['de'])
+            self.assertIn(expected, _STARTER_SETS['de'])
 
-    @patch('chat.views.random.choice')
-    def test_chat_view_with_no_messages_shows_conversation_starter(
-        self, mock_choice: Any
-    ) -> None:
-        """Test that a conversation with no messages shows a random conversation starter."""
-        mock_choice.return_value = "What's your favorite food?"
+    def test_conversation_language_choices_validation(self) -> None:
+        """Test that language choices are properly defined."""
+        expected_choices = [
+            ('en', 'English'),
+            ('es', 'Spanish'),
+            ('de', 'German'),
+        ]
+
+        self.assertEqual(Conversation.LANGUAGE_CHOICES, expected_choices)
+
+
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ConversationStarterTestCase(TestCase):
+    """Test cases for the conversation starter feature."""
+
+    user: User
+    conv_with_msg: Conversation
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create shared fixtures once per class; tests roll back around them."""
+        cls.user = User.objects.create_user(
+            username='testuser', email='test@example.com', password='testpass123'
+        )
+        # Conversation-with-one-message shape, shared by any test that needs
+        # an existing exchange rather than a blank conversation
+        cls.conv_with_msg = Conversation.objects.create(user=cls.user)
+        ChatMessage.objects.create(
+            conversation=cls.conv_with_msg, message="Hello", response="Hi there!"
+        )
 
+    def setUp(self) -> None:
+        """Log in with a fresh client; client state is per-test."""
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_chat_view_with_no_messages_shows_conversation_starter(self) -> None:
+        """Test that a conversation with no messages shows its deterministic starter."""
         conversation = Conversation.objects.create(user=self.user)
         url = reverse('chat', args=[conversation.id])
 
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        # Check that the conversation starter appears in the template context
+        # Starter selection is deterministic: indexed by conversation id
+        starters = CONVERSATION_STARTERS['en']
         self.assertEqual(
-            response.context['conversation_starter'], "What's your favorite food?"
+            response.context['conversation_starter'],
+            starters[conversation.id % len(starters)],
         )
         # Check that the Gemini greeting appears (indicates conversation starter section is rendering)
         self.assertContains(response, "Hello! I'm Gemini.")
-        # Verify random.choice was called with our starters list for English
-        from .views import CONVERSATION_STARTERS
 
-        mock_choice.assert_called_once_with(CONVERSATION_STARTERS['en'])
-
-    @patch('chat.views.random.choice')
-    def test_chat_view_with_messages_doesnt_show_conversation_starter(
-        self, mock_choice: Any
-    ) -> None:
+    def test_chat_view_with_messages_doesnt_show_conversation_starter(self) -> None:
         """Test that a conversation with existing messages doesn't show conversation starter in template."""
-        mock_choice.return_value = "What's your favorite food?"
-
-        conversation = Conversation.objects.create(user=self.user)
-        ChatMessage.objects.create(
-            conversation=conversation, message="Hello", response="Hi there!"
-        )
-
-        url = reverse('chat', args=[conversation.id])
-        response = self.client.get(url)
+        url = reverse('chat', args=[self.conv_with_msg.id])
+        # Pin the view's query count so an N+1 regression fails loudly here
+        with self.assertNumQueries(8):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
-        # Should still have conversation_starter in context, but it won't be rendered
-        self.assertEqual(
-            response.context['conversation_starter'], "What's your favorite food?"
-        )
+        # Existing conversations skip starter selection entirely
+        self.assertIsNone(response.context['conversation_starter'])
         # Should not contain the starter message since we have existing messages
         self.assertNotContains(response, "What's your favorite food?")
         # Should contain our actual messages
@@ -710,29 +987,27 @@ class ConversationStarterTestCase(TestCase):
         self.assertContains(response, "Hi there!")
 
     def test_chat_view_conversation_starter_randomness(self) -> None:
-        """Test that different conversations get different starters (with high probability)."""
-        from .views import CONVERSATION_STARTERS
+        """Test that different conversations get different (id-indexed) starters."""
+        starters_seen: set[str] = set()
 
-        starters_seen = set()
+        # One INSERT round-trip instead of ten
+        conversations = Conversation.objects.bulk_create(
+            [Conversation(user=self.user) for _ in range(10)]
+        )
 
-        # Create multiple conversations and check their starters
-        for i in range(10):
-            conversation = Conversation.objects.create(user=self.user)
+        # Check the starter rendered for each conversation
+        for conversation in conversations:
             url = reverse('chat', args=[conversation.id])
 
             response = self.client.get(url)
             self.assertEqual(response.status_code, 200)
 
-            # Extract the conversation starter from the response
-            content = response.content.decode()
-            # Check all English starters since conversation has default language 'en'
-            for starter in CONVERSATION_STARTERS['en']:
-                if starter in content:
-                    starters_seen.add(starter)
-                    break
+            # The view exposes the chosen starter in the template context, so
+            # read it directly instead of scanning the rendered HTML
+            starters_seen.add(response.context['conversation_starter'])
 
-        # We should see some variety (at least 2 different starters in 10 tries)
-        # This test has a small chance of failing due to randomness, but it's very unlikely
+        # Sequential ids walk through the starter tuple, so ten fresh
+        # conversations must surface several different starters
         self.assertGreaterEqual(len(starters_seen), 2)
 
     def test_chat_view_requires_login(self) -> None:
@@ -764,7 +1039,7 @@ class ConversationStarterTestCase(TestCase):
 
     def test_new_conversation_creation(self) -> None:
         """Test that new_conversation creates a conversation and redirects to it."""
-        url = reverse('new_conversation')
+        url = NEW_CONVERSATION_URL
         response = self.client.get(url)
 
         # Should redirect to the newly created conversation
@@ -783,137 +1058,149 @@ class ConversationStarterTestCase(TestCase):
         conversation = Conversation.objects.create(user=self.user)
         url = reverse('chat', args=[conversation.id])
 
-        response = self.client.get(url)
+        # Pin the view's query count so an N+1 regression fails loudly here
+        with self.assertNumQueries(8):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, 200)
         self.assertIn('conversation_starter', response.context)
-        from .views import CONVERSATION_STARTERS
-
-        self.assertIn(
-            response.context['conversation_starter'], CONVERSATION_STARTERS['en']
-        )
+        self.assertIn(response.context['conversation_starter'], _STARTER_SETS['en'])
 
 
-class LanguageSelectionTest(TransactionTestCase):
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class LanguageSelectionTest(TestCase):
     """Test cases for language selection functionality."""
 
     def setUp(self) -> None:
-        """Set up test data."""
-        self.client = AsyncClient()
+        """Point self.client at the shared client with a clean cookie jar."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
 
     async def asetUp(self) -> None:
         """Set up async test data."""
-        self.user = await User.objects.acreate_user(
-            username='testuser', email='test@example.com', password='testpass123'
+        self.user = await User.objects.acreate(
+            username='testuser',
+            email='test@example.com',
+            password=_TEST_PASSWORD_HASH,
         )
 
     async def test_language_selection_view_requires_login(self) -> None:
         """Test that language selection view requires authentication."""
         await self.asetUp()
-        response = await self.client.get(reverse('language_selection'))
+        response = await self.client.get(LANGUAGE_SELECTION_URL)
         self.assertEqual(response.status_code, 302)
         self.assertIn('/login/', response.url)
 
     async def test_language_selection_view_authenticated(self) -> None:
         """Test language selection view for authenticated user."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
-        response = await self.client.get(reverse('language_selection'))
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
+        response = await self.client.get(LANGUAGE_SELECTION_URL)
         self.assertEqual(response.status_code, 200)
-        # Template contains the expected text
-        content = response.content.decode()
-        self.assertIn("Choose Your Language", content)
-        self.assertIn("English", content)
-        self.assertIn("Spanish", content)
-        self.assertIn("German", content)
+        # Template contains the expected text; search the raw bytes to skip
+        # decoding the full body
+        self.assertIn(b"Choose Your Language", response.content)
+        self.assertIn(b"English", response.content)
+        self.assertIn(b"Spanish", response.content)
+        self.assertIn(b"German", response.content)
 
     async def test_new_conversation_with_language_selection(self) -> None:
         """Test creating new conversation with language selection."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Test creating Spanish conversation
-        response = await self.client.post(
-            reverse('new_conversation'), {'language': 'es'}
-        )
+        response = await self.client.post(NEW_CONVERSATION_URL, {'language': 'es'})
         self.assertEqual(response.status_code, 302)
 
         # Get the created conversation
-        conversation = await Conversation.objects.filter(user=self.user).afirst()
-        self.assertIsNotNone(conversation)
+        conversation = await _conversation_from_redirect(response)
         self.assertEqual(conversation.language, 'es')
 
     async def test_new_conversation_with_invalid_language(self) -> None:
         """Test creating conversation with invalid language defaults to English."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
-
-        response = await self.client.post(
-            reverse('new_conversation'), {'language': 'invalid'}
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
         )
+
+        response = await self.client.post(NEW_CONVERSATION_URL, {'language': 'invalid'})
         self.assertEqual(response.status_code, 302)
 
-        conversation = await Conversation.objects.filter(user=self.user).afirst()
-        self.assertIsNotNone(conversation)
+        conversation = await _conversation_from_redirect(response)
         self.assertEqual(conversation.language, 'en')  # Should default to English
 
     async def test_new_conversation_without_language(self) -> None:
         """Test creating conversation without language parameter defaults to English."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
-        response = await self.client.get(reverse('new_conversation'))
+        response = await self.client.get(NEW_CONVERSATION_URL)
         self.assertEqual(response.status_code, 302)
 
-        conversation = await Conversation.objects.filter(user=self.user).afirst()
-        self.assertIsNotNone(conversation)
+        conversation = await _conversation_from_redirect(response)
         self.assertEqual(conversation.language, 'en')  # Should default to English
 
     async def test_new_conversation_with_analysis_language(self) -> None:
         """Test creating conversation with both language and analysis_language."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Test German conversation with English analysis
         response = await self.client.post(
-            reverse('new_conversation'), {'language': 'de', 'analysis_language': 'en'}
+            NEW_CONVERSATION_URL, {'language': 'de', 'analysis_language': 'en'}
         )
         self.assertEqual(response.status_code, 302)
 
-        conversation = await Conversation.objects.filter(user=self.user).afirst()
-        self.assertIsNotNone(conversation)
+        conversation = await _conversation_from_redirect(response)
         self.assertEqual(conversation.language, 'de')  # German conversation
         self.assertEqual(conversation.analysis_language, 'en')  # English analysis
 
     async def test_new_conversation_with_invalid_analysis_language(self) -> None:
         """Test creating conversation with invalid analysis_language defaults to English."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         response = await self.client.post(
-            reverse('new_conversation'),
+            NEW_CONVERSATION_URL,
             {'language': 'es', 'analysis_language': 'invalid'},
         )
         self.assertEqual(response.status_code, 302)
 
-        conversation = await Conversation.objects.filter(user=self.user).afirst()
-        self.assertIsNotNone(conversation)
+        conversation = await _conversation_from_redirect(response)
         self.assertEqual(conversation.language, 'es')  # Spanish conversation
         self.assertEqual(
             conversation.analysis_language, 'en'
         )  # Should default to English
 
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class LanguageSpecificConversationTest(TestCase):
     """Test language-specific conversation functionality."""
 
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the shared user once for the whole class."""
+        cls.user = User.objects.create_user(
+            username='testuser', email='test@example.com', password='testpass123'
+        )
+
     def setUp(self) -> None:
         """Set up test data."""
         self.client = Client()
-        self.user = User.objects.create_user(
-            username='testuser', email='test@example.com', password='testpass123'
-        )
-        self.client.login(username='testuser', password='testpass123')
+        self.client.force_login(self.user)
 
     def test_spanish_conversation_starter(self) -> None:
         """Test that Spanish conversations show Spanish starters."""
@@ -923,17 +1210,12 @@ class LanguageSpecificConversationTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
-        # Should contain a Spanish greeting
-        content = response.content.decode()
-        from .views import CONVERSATION_STARTERS
-
-        # Check if any Spanish starter appears in the content
-        spanish_starter_found = False
-        for starter in CONVERSATION_STARTERS['es']:
-            if starter in content:
-                spanish_starter_found = True
-                break
-        self.assertTrue(spanish_starter_found, "No Spanish conversation starter found")
+        # Should contain a Spanish greeting: one pass with the precompiled
+        # alternation instead of a scan per starter
+        self.assertIsNotNone(
+            _STARTER_PATTERNS['es'].search(response.content),
+            "No Spanish conversation starter found",
+        )
 
     def test_german_conversation_starter(self) -> None:
         """Test that German conversations show German starters."""
@@ -943,55 +1225,55 @@ class LanguageSpecificConversationTest(TestCase):
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
-        # Should contain a German greeting
-        content = response.content.decode()
-        from .views import CONVERSATION_STARTERS
-
-        # Check if any German starter appears in the content
-        german_starter_found = False
-        for starter in CONVERSATION_STARTERS['de']:
-            if starter in content:
-                german_starter_found = True
-                break
-        self.assertTrue(german_starter_found, "No German conversation starter found")
+        # Should contain a German greeting: one pass with the precompiled
+        # alternation instead of a scan per starter
+        self.assertIsNotNone(
+            _STARTER_PATTERNS['de'].search(response.content),
+            "No German conversation starter found",
+        )
 
-    @patch('chat.views.random.choice')
-    def test_language_specific_starter_selection(self, mock_choice: Any) -> None:
+    def test_language_specific_starter_selection(self) -> None:
         """Test that conversation starters are selected from correct language."""
-        mock_choice.return_value = "¿Qué hiciste hoy?"
-
         conversation = Conversation.objects.create(user=self.user, language='es')
         url = reverse('chat', args=[conversation.id])
 
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
-        # Verify random.choice was called with Spanish starters
-        from .views import CONVERSATION_STARTERS
-
-        mock_choice.assert_called_once_with(CONVERSATION_STARTERS['es'])
+        # The starter must come from the Spanish tuple (id-indexed)
+        starters = CONVERSATION_STARTERS['es']
+        self.assertEqual(
+            response.context['conversation_starter'],
+            starters[conversation.id % len(starters)],
+        )
 
 
-class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class AsyncLanguageSpecificAIServiceTest(TestCase):
     """Test language-specific AI service functionality."""
 
     def setUp(self) -> None:
-        """Set up test data."""
-        self.client = AsyncClient()
+        """Share the client, clear its cookies and patch the AI service once."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
+        patcher = patch('chat.views.ai_service')
+        self.mock_ai_service = patcher.start()
+        self.addCleanup(patcher.stop)
 
     async def asetUp(self) -> None:
         """Set up async test data."""
-        self.user = await User.objects.acreate_user(
-            username='testuser', password='testpass123', email='test@example.com'
+        self.user = await User.objects.acreate(
+            username='testuser',
+            email='test@example.com',
+            password=_TEST_PASSWORD_HASH,
         )
 
-    @patch('chat.views.ai_service')
-    async def test_send_message_spanish_conversation(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_send_message_spanish_conversation(self) -> None:
         """Test sending message in Spanish conversation calls AI with Spanish language."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Create Spanish conversation
         spanish_conversation = await Conversation.objects.acreate(
@@ -999,15 +1281,15 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         )
 
         # Mock AI service
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Respuesta en español"
         )
-        mock_ai_service.analyze_grammar = AsyncMock(
+        self.mock_ai_service.analyze_grammar = AsyncMock(
             return_value="Sin problemas gramaticales."
         )
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Hola, ¿cómo estás?',
                 'conversation_id': str(spanish_conversation.id),
@@ -1017,17 +1299,16 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify AI service was called with Spanish language and empty history
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Hola, ¿cómo estás?', 'es', []
         )
 
-    @patch('chat.views.ai_service')
-    async def test_grammar_analysis_german_conversation(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_grammar_analysis_german_conversation(self) -> None:
         """Test grammar analysis in German conversation uses analysis language (default English)."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Create German conversation (analysis_language defaults to 'en')
         german_conversation = await Conversation.objects.acreate(
@@ -1035,13 +1316,15 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         )
 
         # Mock AI service
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Deutsche Antwort"
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="Grammar error found.")
+        self.mock_ai_service.analyze_grammar = AsyncMock(
+            return_value="Grammar error found."
+        )
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Wie geht es dir?',
                 'conversation_id': str(german_conversation.id),
@@ -1049,19 +1332,19 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         )
 
         self.assertEqual(response.status_code, 200)
+        await _drain_grammar_tasks()
 
         # Verify grammar analysis was called with analysis language (English by default)
-        mock_ai_service.analyze_grammar.assert_called_once_with(
+        self.mock_ai_service.analyze_grammar.assert_called_once_with(
             'Wie geht es dir?', 'en', 'de'  # analysis_language=en, language_code=de
         )
 
-    @patch('chat.views.ai_service')
-    async def test_grammar_analysis_different_from_conversation_language(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_grammar_analysis_different_from_conversation_language(self) -> None:
         """Test grammar analysis uses analysis_language when different from conversation language."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Create German conversation with English analysis
         german_conversation = await Conversation.objects.acreate(
@@ -1069,15 +1352,15 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         )
 
         # Mock AI service
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Deutsche Antwort"
         )
-        mock_ai_service.analyze_grammar = AsyncMock(
+        self.mock_ai_service.analyze_grammar = AsyncMock(
             return_value="Grammar error found in English feedback."
         )
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Wie geht es dir?',
                 'conversation_id': str(german_conversation.id),
@@ -1087,22 +1370,22 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify chat response was called with German (conversation language) and empty history
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Wie geht es dir?', 'de', []
         )
 
         # Verify grammar analysis was called with English (analysis language)
-        mock_ai_service.analyze_grammar.assert_called_once_with(
+        await _drain_grammar_tasks()
+        self.mock_ai_service.analyze_grammar.assert_called_once_with(
             'Wie geht es dir?', 'en', 'de'  # analysis_language=en, language_code=de
         )
 
-    @patch('chat.views.ai_service')
-    async def test_conversation_analysis_uses_analysis_language(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_conversation_analysis_uses_analysis_language(self) -> None:
         """Test conversation analysis uses the conversation's analysis language."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Create Spanish conversation with English analysis (analysis_language defaults to 'en')
         spanish_conversation = await Conversation.objects.acreate(
@@ -1116,7 +1399,7 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         )
 
         # Mock AI service
-        mock_ai_service.analyze_conversation = AsyncMock(
+        self.mock_ai_service.analyze_conversation = AsyncMock(
             return_value="* Strengths: Appropriate greeting\n* Recommendations: Continue practicing"
         )
 
@@ -1130,8 +1413,8 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify conversation analysis was called with analysis language (English by default)
-        mock_ai_service.analyze_conversation.assert_called_once()
-        call_args = mock_ai_service.analyze_conversation.call_args
+        self.mock_ai_service.analyze_conversation.assert_called_once()
+        call_args = self.mock_ai_service.analyze_conversation.call_args
         # Check the keyword arguments or positional arguments
         if len(call_args) > 1 and len(call_args[0]) > 1:
             # Positional argument
@@ -1143,12 +1426,17 @@ class AsyncLanguageSpecificAIServiceTest(TransactionTestCase):
             self.assertEqual(call_args[1].get('language_code'), 'en')
 
 
-class ConversationMemoryTest(TransactionTestCase):
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
+class ConversationMemoryTest(TestCase):
     """Test conversation memory functionality using Pydantic AI conversation history."""
 
     def setUp(self) -> None:
-        """Set up test data."""
-        self.client = AsyncClient()
+        """Share the client, clear its cookies and patch the AI service once."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
+        patcher = patch('chat.views.ai_service')
+        self.mock_ai_service = patcher.start()
+        self.addCleanup(patcher.stop)
 
     async def asetUp(self) -> None:
         """Set up async test data."""
@@ -1159,19 +1447,20 @@ class ConversationMemoryTest(TransactionTestCase):
             user=self.user, title='Test Conversation'
         )
 
-    @patch('chat.views.ai_service')
-    async def test_first_message_no_history(self, mock_ai_service: MagicMock) -> None:
+    async def test_first_message_no_history(self) -> None:
         """Test that first message in conversation has no history."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Hello! Nice to meet you."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Hi there!',
                 'conversation_id': str(self.conversation.id),
@@ -1180,17 +1469,16 @@ class ConversationMemoryTest(TransactionTestCase):
 
         self.assertEqual(response.status_code, 200)
         # Verify AI service was called with empty conversation history
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Hi there!', 'en', []  # Empty history for first message
         )
 
-    @patch('chat.views.ai_service')
-    async def test_second_message_includes_history(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_second_message_includes_history(self) -> None:
         """Test that second message includes conversation history."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
+        )
 
         # Create first message in conversation
         first_message = await ChatMessage.objects.acreate(
@@ -1199,13 +1487,13 @@ class ConversationMemoryTest(TransactionTestCase):
             response="Hello! Nice to meet you.",
         )
 
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="My name is Claude."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'What is your name?',
                 'conversation_id': str(self.conversation.id),
@@ -1215,46 +1503,38 @@ class ConversationMemoryTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify AI service was called with conversation history
-        expected_history = [
-            {'role': 'user', 'content': 'Hi there!'},
-            {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
-        ]
-        mock_ai_service.generate_chat_response.assert_called_once_with(
-            'What is your name?', 'en', expected_history
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
+            'What is your name?', 'en', _HELLO_HISTORY
         )
 
-    @patch('chat.views.ai_service')
-    async def test_multiple_messages_build_history(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_multiple_messages_build_history(self) -> None:
         """Test that multiple messages build up conversation history."""
         await self.asetUp()
-        await sync_to_async(self.client.force_login)(self.user)
-
-        # Create multiple messages in conversation
-        await ChatMessage.objects.acreate(
-            conversation=self.conversation,
-            message="Hi there!",
-            response="Hello! Nice to meet you.",
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = await _acreate_session_for(
+            self.user
         )
-        await ChatMessage.objects.acreate(
-            conversation=self.conversation,
-            message="What is your name?",
-            response="My name is Claude.",
-        )
-        await ChatMessage.objects.acreate(
-            conversation=self.conversation,
-            message="Do you have any hobbies?",
-            response="I enjoy helping with various tasks.",
+
+        # Create multiple messages in conversation with one INSERT
+        await ChatMessage.objects.abulk_create(
+            [
+                ChatMessage(
+                    conversation=self.conversation, message=message, response=response
+                )
+                for message, response in [
+                    ("Hi there!", "Hello! Nice to meet you."),
+                    ("What is your name?", "My name is Claude."),
+                    ("Do you have any hobbies?", "I enjoy helping with various tasks."),
+                ]
+            ]
         )
 
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Yes, I remember you asked about my name earlier."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         response = await self.client.post(
-            reverse('send_message'),
+            SEND_MESSAGE_URL,
             {
                 'message': 'Do you remember our conversation?',
                 'conversation_id': str(self.conversation.id),
@@ -1264,15 +1544,11 @@ class ConversationMemoryTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify AI service was called with full conversation history
-        expected_history = [
-            {'role': 'user', 'content': 'Hi there!'},
-            {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
-            {'role': 'user', 'content': 'What is your name?'},
-            {'role': 'assistant', 'content': 'My name is Claude.'},
+        expected_history = _HELLO_NAME_HISTORY + [
             {'role': 'user', 'content': 'Do you have any hobbies?'},
             {'role': 'assistant', 'content': 'I enjoy helping with various tasks.'},
         ]
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Do you remember our conversation?', 'en', expected_history
         )
 
@@ -1283,10 +1559,7 @@ class ConversationMemoryTest(TransactionTestCase):
         """Test that AI service correctly builds Pydantic AI message objects for conversation history."""
         await self.asetUp()
 
-        mock_agent_instance = AsyncMock()
-        mock_result = AsyncMock()
-        mock_result.output = "I remember you asked about my name."
-        mock_agent_instance.run.return_value = mock_result
+        mock_agent_instance = _make_agent("I remember you asked about my name.")
         MockAgent.return_value = mock_agent_instance
 
         from chat.ai_service import AIService
@@ -1343,30 +1616,34 @@ class ConversationMemoryTest(TransactionTestCase):
             user=self.user, title='Second Conversation'
         )
 
-        # Add messages to first conversation
-        await ChatMessage.objects.acreate(
-            conversation=self.conversation,
-            message="My dog's name is Toby",
-            response="That's a nice name for a dog!",
-        )
-
-        # Add different messages to second conversation
-        await ChatMessage.objects.acreate(
-            conversation=second_conversation,
-            message="My cat's name is Whiskers",
-            response="That's a great name for a cat!",
+        # Seed both conversations with one INSERT
+        await ChatMessage.objects.abulk_create(
+            [
+                ChatMessage(
+                    conversation=self.conversation,
+                    message="My dog's name is Toby",
+                    response="That's a nice name for a dog!",
+                ),
+                ChatMessage(
+                    conversation=second_conversation,
+                    message="My cat's name is Whiskers",
+                    response="That's a great name for a cat!",
+                ),
+            ]
         )
 
         # Test that first conversation only sees its own history
-        with patch('chat.views.ai_service') as mock_ai_service:
-            mock_ai_service.generate_chat_response = AsyncMock(
+        with patch('chat.views.ai_service') as self.mock_ai_service:
+            self.mock_ai_service.generate_chat_response = AsyncMock(
                 return_value="Yes, your dog's name is Toby."
             )
-            mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+            self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
-            await sync_to_async(self.client.force_login)(self.user)
+            self.client.cookies[settings.SESSION_COOKIE_NAME] = (
+                await _acreate_session_for(self.user)
+            )
             response = await self.client.post(
-                reverse('send_message'),
+                SEND_MESSAGE_URL,
                 {
                     'message': 'What is my pet\'s name?',
                     'conversation_id': str(self.conversation.id),
@@ -1380,30 +1657,40 @@ class ConversationMemoryTest(TransactionTestCase):
                 {'role': 'user', 'content': "My dog's name is Toby"},
                 {'role': 'assistant', 'content': "That's a nice name for a dog!"},
             ]
-            mock_ai_service.generate_chat_response.assert_called_once_with(
+            self.mock_ai_service.generate_chat_response.assert_called_once_with(
                 'What is my pet\'s name?', 'en', expected_history
             )
 
 
-class DemoModeConversationMemoryTest(TransactionTestCase):
+class DemoModeConversationMemoryTest(TestCase):
     """Test conversation memory functionality in demo mode using session storage."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.client = AsyncClient()
+    # Second client for the session-isolation test; built once since
+    # AsyncClient construction resolves the middleware stack
+    client_b: AsyncClient
 
-    @patch('chat.views.ai_service')
-    async def test_demo_first_message_no_history(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.client_b = AsyncClient()
+
+    def setUp(self) -> None:
+        """Share the client, clear its cookies and patch the AI service once."""
+        self.client = _SHARED_ASYNC_CLIENT
+        self.client.cookies.clear()
+        patcher = patch('chat.views.ai_service')
+        self.mock_ai_service = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_demo_first_message_no_history(self) -> None:
         """Test that first message in demo mode has no history."""
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Hello! Nice to meet you."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         response = await self.client.post(
-            reverse('demo_send_message'),
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'Hi there!',
                 'language': 'en',
@@ -1413,23 +1700,20 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
 
         self.assertEqual(response.status_code, 200)
         # Verify AI service was called with empty conversation history
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Hi there!', 'en', []  # Empty history for first message
         )
 
-    @patch('chat.views.ai_service')
-    async def test_demo_second_message_includes_history(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_demo_second_message_includes_history(self) -> None:
         """Test that second message in demo mode includes conversation history from session."""
         # First send a message to populate the session
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Hello! Nice to meet you."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         await self.client.post(
-            reverse('demo_send_message'),
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'Hi there!',
                 'language': 'en',
@@ -1438,15 +1722,15 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
         )
 
         # Reset mock for second call
-        mock_ai_service.reset_mock()
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.reset_mock()
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="My name is Claude."
         )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         # Send second message
         response = await self.client.post(
-            reverse('demo_send_message'),
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'What is your name?',
                 'language': 'en',
@@ -1457,104 +1741,35 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify AI service was called with conversation history
-        expected_history = [
-            {'role': 'user', 'content': 'Hi there!'},
-            {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
-        ]
-        mock_ai_service.generate_chat_response.assert_called_once_with(
-            'What is your name?', 'en', expected_history
-        )
-
-    @patch('chat.views.ai_service')
-    async def test_demo_session_gets_updated_with_new_messages(
-        self, mock_ai_service: MagicMock
-    ) -> None:
-        """Test that session gets updated with new messages after AI response."""
-        mock_ai_service.generate_chat_response = AsyncMock(
-            return_value="Hello! Nice to meet you."
-        )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
-
-        # Make first request
-        response1 = await self.client.post(
-            reverse('demo_send_message'),
-            {
-                'message': 'Hi there!',
-                'language': 'en',
-                'analysis_language': 'en',
-            },
-        )
-        self.assertEqual(response1.status_code, 200)
-
-        # Verify second request includes history from first
-        mock_ai_service.reset_mock()
-        mock_ai_service.generate_chat_response = AsyncMock(
-            return_value="My name is Claude."
-        )
-
-        response2 = await self.client.post(
-            reverse('demo_send_message'),
-            {
-                'message': 'What is your name?',
-                'language': 'en',
-                'analysis_language': 'en',
-            },
-        )
-
-        self.assertEqual(response2.status_code, 200)
-
-        # Verify history was passed correctly
-        expected_history = [
-            {'role': 'user', 'content': 'Hi there!'},
-            {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
-        ]
-        mock_ai_service.generate_chat_response.assert_called_once_with(
-            'What is your name?', 'en', expected_history
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
+            'What is your name?', 'en', _HELLO_HISTORY
         )
 
-    @patch('chat.views.ai_service')
-    async def test_demo_multiple_messages_build_history(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_demo_multiple_messages_build_history(self) -> None:
         """Test that multiple messages build up conversation history in session storage."""
-        # Send first message
-        mock_ai_service.generate_chat_response = AsyncMock(
-            return_value="Hello! Nice to meet you."
-        )
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
-
-        await self.client.post(
-            reverse('demo_send_message'),
-            {
-                'message': 'Hi there!',
-                'language': 'en',
-                'analysis_language': 'en',
-            },
-        )
-
-        # Send second message
-        mock_ai_service.reset_mock()
-        mock_ai_service.generate_chat_response = AsyncMock(
-            return_value="My name is Claude."
-        )
-
-        await self.client.post(
-            reverse('demo_send_message'),
-            {
-                'message': 'What is your name?',
-                'language': 'en',
-                'analysis_language': 'en',
-            },
+        # One mock drives all three turns via side_effect; no reset_mock or
+        # reassignment between requests
+        self.mock_ai_service.generate_chat_response = AsyncMock(
+            side_effect=[
+                "Hello! Nice to meet you.",
+                "My name is Claude.",
+                "Yes, I remember you asked about my name earlier.",
+            ]
         )
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
-        # Send third message and verify full history
-        mock_ai_service.reset_mock()
-        mock_ai_service.generate_chat_response = AsyncMock(
-            return_value="Yes, I remember you asked about my name earlier."
-        )
+        for message in ['Hi there!', 'What is your name?']:
+            await self.client.post(
+                DEMO_SEND_MESSAGE_URL,
+                {
+                    'message': message,
+                    'language': 'en',
+                    'analysis_language': 'en',
+                },
+            )
 
         response = await self.client.post(
-            reverse('demo_send_message'),
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'Do you remember our conversation?',
                 'language': 'en',
@@ -1564,31 +1779,23 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
 
         self.assertEqual(response.status_code, 200)
 
-        # Verify AI service was called with full conversation history
-        expected_history = [
-            {'role': 'user', 'content': 'Hi there!'},
-            {'role': 'assistant', 'content': 'Hello! Nice to meet you.'},
-            {'role': 'user', 'content': 'What is your name?'},
-            {'role': 'assistant', 'content': 'My name is Claude.'},
-        ]
-        mock_ai_service.generate_chat_response.assert_called_once_with(
-            'Do you remember our conversation?', 'en', expected_history
+        # Verify the final call received the full conversation history
+        self.assertEqual(
+            self.mock_ai_service.generate_chat_response.call_args_list[-1],
+            (('Do you remember our conversation?', 'en', _HELLO_NAME_HISTORY), {}),
         )
 
-    @patch('chat.views.ai_service')
-    async def test_demo_conversation_memory_with_different_languages(
-        self, mock_ai_service: MagicMock
-    ) -> None:
+    async def test_demo_conversation_memory_with_different_languages(self) -> None:
         """Test that demo conversation memory works with different languages."""
-        mock_ai_service.generate_chat_response = AsyncMock(
+        self.mock_ai_service.generate_chat_response = AsyncMock(
             return_value="Hola! ¿Cómo estás?"
         )
-        mock_ai_service.analyze_grammar = AsyncMock(
+        self.mock_ai_service.analyze_grammar = AsyncMock(
             return_value="Sin problemas gramaticales."
         )
 
         response = await self.client.post(
-            reverse('demo_send_message'),
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': '¡Hola! Soy nuevo aquí.',
                 'language': 'es',
@@ -1599,69 +1806,63 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         # Verify Spanish conversation was handled correctly
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             '¡Hola! Soy nuevo aquí.', 'es', []
         )
 
     async def test_demo_clear_conversation_history(self) -> None:
         """Test that demo conversation history can be cleared."""
-        # Send a message first to populate history
-        with patch('chat.views.ai_service') as mock_ai_service:
-            mock_ai_service.generate_chat_response = AsyncMock(return_value="Hello!")
-            mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        # One mock covers both sends; the setUp patcher is already active
+        self.mock_ai_service.generate_chat_response = AsyncMock(
+            side_effect=["Hello!", "Hello again!"]
+        )
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
-            await self.client.post(
-                reverse('demo_send_message'),
-                {
-                    'message': 'Hi there!',
-                    'language': 'en',
-                    'analysis_language': 'en',
-                },
-            )
+        # Send a message first to populate history
+        await self.client.post(
+            DEMO_SEND_MESSAGE_URL,
+            {
+                'message': 'Hi there!',
+                'language': 'en',
+                'analysis_language': 'en',
+            },
+        )
 
         # Clear the conversation
-        response = await self.client.post(reverse('demo_clear_conversation'))
+        response = await self.client.post(DEMO_CLEAR_CONVERSATION_URL)
 
         self.assertEqual(response.status_code, 200)
-        response_data = json.loads(response.content)
-        self.assertEqual(response_data['status'], 'success')
+        self.assertEqual(response.json()['status'], 'success')
 
         # Verify next message has no history
-        with patch('chat.views.ai_service') as mock_ai_service:
-            mock_ai_service.generate_chat_response = AsyncMock(
-                return_value="Hello again!"
-            )
-            mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
-
-            await self.client.post(
-                reverse('demo_send_message'),
-                {
-                    'message': 'Hi again!',
-                    'language': 'en',
-                    'analysis_language': 'en',
-                },
-            )
+        await self.client.post(
+            DEMO_SEND_MESSAGE_URL,
+            {
+                'message': 'Hi again!',
+                'language': 'en',
+                'analysis_language': 'en',
+            },
+        )
 
-            # Should be called with empty history after clear
-            mock_ai_service.generate_chat_response.assert_called_once_with(
-                'Hi again!', 'en', []
-            )
+        # Should be called with empty history after clear
+        self.assertEqual(
+            self.mock_ai_service.generate_chat_response.call_args_list[-1],
+            (('Hi again!', 'en', []), {}),
+        )
 
     async def test_demo_clear_conversation_only_post(self) -> None:
         """Test that demo clear conversation only accepts POST requests."""
-        response = await self.client.get(reverse('demo_clear_conversation'))
+        response = await self.client.get(DEMO_CLEAR_CONVERSATION_URL)
         self.assertEqual(response.status_code, 405)
 
-    @patch('chat.views.ai_service')
-    async def test_demo_isolated_sessions(self, mock_ai_service: MagicMock) -> None:
+    async def test_demo_isolated_sessions(self) -> None:
         """Test that different browser sessions have isolated conversation histories."""
-        mock_ai_service.generate_chat_response = AsyncMock(return_value="Hello!")
-        mock_ai_service.analyze_grammar = AsyncMock(return_value="No issues found.")
+        self.mock_ai_service.generate_chat_response = AsyncMock(return_value="Hello!")
+        self.mock_ai_service.analyze_grammar = _NO_ISSUES_ANALYSIS
 
         # First client/session
-        client1 = AsyncClient()
-        await client1.post(
-            reverse('demo_send_message'),
+        await self.client.post(
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'Hi from session 1!',
                 'language': 'en',
@@ -1670,11 +1871,11 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
         )
 
         # Second client/session - this should have empty history
-        client2 = AsyncClient()
-        mock_ai_service.reset_mock()
+        self.client_b.cookies.clear()
+        self.mock_ai_service.reset_mock()
 
-        response2 = await client2.post(
-            reverse('demo_send_message'),
+        response2 = await self.client_b.post(
+            DEMO_SEND_MESSAGE_URL,
             {
                 'message': 'Hi from session 2!',
                 'language': 'en',
@@ -1685,65 +1886,45 @@ class DemoModeConversationMemoryTest(TransactionTestCase):
         self.assertEqual(response2.status_code, 200)
 
         # Session 2 should start with empty history (isolated from session 1)
-        mock_ai_service.generate_chat_response.assert_called_once_with(
+        self.mock_ai_service.generate_chat_response.assert_called_once_with(
             'Hi from session 2!', 'en', []
         )
 
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class ConversationModelTest(TestCase):
     """Test Conversation model with language field."""
 
-    def setUp(self) -> None:
-        """Set up test data."""
-        self.user = User.objects.create_user(
+    user: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        """Create the shared user once per class; tests roll back around it."""
+        cls.user = User.objects.create_user(
             username='testuser', email='test@example.com', password='testpass123'
         )
 
-    def test_conversation_default_language(self) -> None:
-        """Test that conversations default to English."""
-        conversation = Conversation.objects.create(user=self.user)
-        self.assertEqual(conversation.language, 'en')
-
-    def test_conversation_language_choices(self) -> None:
-        """Test that all supported languages can be set."""
-        # Test English
-        en_conversation = Conversation.objects.create(user=self.user, language='en')
-        self.assertEqual(en_conversation.language, 'en')
-
-        # Test Spanish
-        es_conversation = Conversation.objects.create(user=self.user, language='es')
-        self.assertEqual(es_conversation.language, 'es')
-
-        # Test German
-        de_conversation = Conversation.objects.create(user=self.user, language='de')
-        self.assertEqual(de_conversation.language, 'de')
-
-    def test_conversation_language_choices_validation(self) -> None:
-        """Test that language choices are properly defined."""
-        from .models import Conversation
-
-        expected_choices = [
-            ('en', 'English'),
-            ('es', 'Spanish'),
-            ('de', 'German'),
+    def test_conversation_language_variants(self) -> None:
+        """Test defaults and explicit values for language/analysis_language.
+
+        One parametrized test keeps every variant inside a single
+        transaction envelope instead of one BEGIN/ROLLBACK per case.
+        Field defaults are populated in __init__, so unsaved instances
+        suffice — no INSERT per case; plenty of other tests cover saving.
+        """
+        # (init kwargs, expected language, expected analysis_language)
+        cases = [
+            ({}, 'en', 'en'),  # both fields default to English
+            ({'language': 'en'}, 'en', 'en'),
+            ({'language': 'es'}, 'es', 'en'),
+            ({'language': 'de'}, 'de', 'en'),
+            ({'language': 'de', 'analysis_language': 'en'}, 'de', 'en'),
         ]
-
-        self.assertEqual(Conversation.LANGUAGE_CHOICES, expected_choices)
-
-    def test_conversation_analysis_language_field(self) -> None:
-        """Test that conversations have analysis_language field."""
-        conversation = Conversation.objects.create(
-            user=self.user,
-            language='de',  # German conversation
-            analysis_language='en',  # English analysis
-        )
-        self.assertEqual(conversation.language, 'de')
-        self.assertEqual(conversation.analysis_language, 'en')
-
-    def test_conversation_analysis_language_default(self) -> None:
-        """Test that analysis_language defaults to English."""
-        conversation = Conversation.objects.create(user=self.user, language='es')
-        self.assertEqual(conversation.analysis_language, 'en')
+        for kwargs, expected_language, expected_analysis in cases:
+            with self.subTest(**kwargs):
+                conversation = Conversation(user=self.user, **kwargs)
+                self.assertEqual(conversation.language, expected_language)
+                self.assertEqual(conversation.analysis_language, expected_analysis)
 
 
 class ConversationEndTest(TransactionTestCase):
@@ -1945,7 +2126,7 @@ class EndConversationViewTest(TransactionTestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class StructuredGrammarAnalysisIntegrationTest(TransactionTestCase):
+class StructuredGrammarAnalysisIntegrationTest(TestCase):
     """Integration tests for StructuredGrammarAnalysis functionality."""
 
     async def asetUp(self) -> None:
@@ -9,6 +9,8 @@ Tests all the features verified in our integration testing:
 - Spaced repetition scheduling
 """
 
+import math
+
 from django.test import TestCase
 from django.contrib.auth.models import User
 from django.utils import timezone
@@ -22,38 +24,47 @@ from chat.models import (
 )
 from chat.similarity_service import similarity_service
 
+# Shared sentinel embeddings: built once at import time instead of
+# allocating fresh 768-float lists in every setUp.
+_ZEROS_766 = [0.0] * 766
+_ONES_766 = [1.0] * 766
+_UNIFORM_01 = [0.1] * 768
+_UNIFORM_012 = [0.12] * 768
+_UNIFORM_08 = [0.8] * 768
+
 
 class LanguageLearningModelsTest(TestCase):
     """Test core language learning model functionality."""
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """Set up test data for language learning tests."""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="language_test_user",
             email="test@example.com",
             password="testpass123",
         )
 
-        self.lang_profile = LanguageProfile.objects.create(
-            user=self.user,
+        cls.lang_profile = LanguageProfile.objects.create(
+            user=cls.user,
             target_language='en',
             current_level='A2',
             proficiency_score=0.4,
             grammar_accuracy=0.5,
         )
 
-        self.concept = GrammarConcept.objects.create(
+        cls.concept = GrammarConcept.objects.create(
             name="Test Grammar Concept",
             description="A test grammar concept for unit testing",
             language='en',
             cefr_level='A2',
             complexity_score=2.0,
             tags=['test', 'grammar'],
-            embedding=[0.1] * 768,  # Test embedding vector
+            embedding=_UNIFORM_01,  # Test embedding vector
         )
 
-        self.conversation = Conversation.objects.create(
-            user=self.user,
+        cls.conversation = Conversation.objects.create(
+            user=cls.user,
             title="Test Conversation",
             language='en',
             analysis_language='en',
@@ -98,6 +109,27 @@ class LanguageLearningModelsTest(TestCase):
         self.assertEqual(mastery.correct_attempts, 1)
         self.assertEqual(mastery.get_success_rate(), 50.0)
 
+    def test_generated_columns_mirror_methods(self):
+        """Test that success_rate/mastered columns track the Python methods."""
+        mastery = ConceptMastery.objects.create(
+            user=self.user,
+            concept=self.concept,
+            mastery_score=0.9,
+            attempts_count=10,
+            correct_attempts=8,
+        )
+
+        # Generated columns are computed by the database on write
+        mastery.refresh_from_db()
+        self.assertAlmostEqual(mastery.success_rate, mastery.get_success_rate())
+        self.assertEqual(mastery.mastered, mastery.is_mastered())
+        self.assertTrue(mastery.mastered)
+
+        # Indexed filtering matches the method's verdict
+        self.assertTrue(
+            ConceptMastery.objects.filter(user=self.user, mastered=True).exists()
+        )
+
     def test_spaced_repetition_scheduling(self):
         """Test spaced repetition interval calculations."""
         mastery = ConceptMastery.objects.create(
@@ -119,6 +151,41 @@ class LanguageLearningModelsTest(TestCase):
 
         self.assertEqual(mastery.repetition_interval, 1)
 
+    def test_bulk_update_performance_matches_single_path(self):
+        """Test that the NumPy batch path mirrors update_performance."""
+        other_concept = GrammarConcept.objects.create(
+            name="Past Tense",
+            description="Simple past tense",
+            language='en',
+            cefr_level='A2',
+            complexity_score=2.0,
+        )
+
+        ConceptMastery.objects.create(user=self.user, concept=self.concept)
+        ConceptMastery.objects.create(user=self.user, concept=other_concept)
+
+        ConceptMastery.bulk_update_performance(
+            self.user,
+            [(self.concept.id, True, 0.2), (other_concept.id, False, 0.5)],
+        )
+
+        # Unsaved reference instances graded through the scalar path
+        for concept, is_correct, difficulty in [
+            (self.concept, True, 0.2),
+            (other_concept, False, 0.5),
+        ]:
+            reference = ConceptMastery(user=self.user, concept=concept)
+            reference.update_performance(is_correct, difficulty)
+
+            mastery = ConceptMastery.objects.get(user=self.user, concept=concept)
+            self.assertEqual(mastery.attempts_count, reference.attempts_count)
+            self.assertEqual(mastery.correct_attempts, reference.correct_attempts)
+            self.assertEqual(mastery.repetition_interval, reference.repetition_interval)
+            self.assertAlmostEqual(mastery.ease_factor, reference.ease_factor)
+            self.assertAlmostEqual(mastery.mastery_score, reference.mastery_score)
+            self.assertIsNotNone(mastery.next_review)
+            self.assertEqual(len(mastery.performance_history), 1)
+
     def test_error_pattern_tracking(self):
         """Test error pattern detection and tracking."""
         # Create error pattern
@@ -206,40 +273,41 @@ class LanguageLearningModelsTest(TestCase):
 class VectorSimilarityTest(TestCase):
     """Test vector similarity search functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up concepts with embeddings for similarity testing."""
         # Create concepts with different embeddings
-        self.concept1 = GrammarConcept.objects.create(
+        cls.concept1 = GrammarConcept.objects.create(
             name="Past Tense",
             description="Simple past tense usage",
             language='en',
             cefr_level='A2',
             complexity_score=2.0,
-            embedding=[0.5, 0.5] + [0.0] * 766,  # Similar to concept2
+            embedding=[0.5, 0.5] + _ZEROS_766,  # Similar to concept2
         )
 
-        self.concept2 = GrammarConcept.objects.create(
+        cls.concept2 = GrammarConcept.objects.create(
             name="Past Participle",
             description="Past participle forms",
             language='en',
             cefr_level='B1',
             complexity_score=3.0,
-            embedding=[0.4, 0.6] + [0.0] * 766,  # Similar to concept1
+            embedding=[0.4, 0.6] + _ZEROS_766,  # Similar to concept1
         )
 
-        self.concept3 = GrammarConcept.objects.create(
+        cls.concept3 = GrammarConcept.objects.create(
             name="Present Continuous",
             description="Progressive present tense",
             language='en',
             cefr_level='A2',
             complexity_score=2.5,
-            embedding=[0.0, 0.0] + [1.0] * 766,  # Different from others
+            embedding=[0.0, 0.0] + _ONES_766,  # Different from others
         )
 
     def test_vector_field_storage_and_retrieval(self):
         """Test that vector embeddings are stored and retrieved correctly."""
         # Test embedding storage
-        test_vector = [0.1, 0.2, 0.3] + [0.0] * 765
+        test_vector = [0.1, 0.2, 0.3] + _ZEROS_766[:-1]
         self.concept1.embedding = test_vector
         self.concept1.save()
 
@@ -247,10 +315,14 @@ class VectorSimilarityTest(TestCase):
         self.concept1.refresh_from_db()
         retrieved_vector = self.concept1.get_embedding_vector()
 
+        # Embeddings are L2-normalized at save time (so inner-product search
+        # matches cosine ranking): direction is preserved, magnitude is not.
+        norm = math.sqrt(sum(x * x for x in test_vector))
         self.assertEqual(len(retrieved_vector), 768)
-        self.assertAlmostEqual(retrieved_vector[0], 0.1, places=5)
-        self.assertAlmostEqual(retrieved_vector[1], 0.2, places=5)
-        self.assertAlmostEqual(retrieved_vector[2], 0.3, places=5)
+        self.assertAlmostEqual(retrieved_vector[0], 0.1 / norm, places=5)
+        self.assertAlmostEqual(retrieved_vector[1], 0.2 / norm, places=5)
+        self.assertAlmostEqual(retrieved_vector[2], 0.3 / norm, places=5)
+        self.assertAlmostEqual(sum(x * x for x in retrieved_vector), 1.0, places=5)
 
     def test_concept_similarity_search(self):
         """Test finding similar concepts using vector similarity."""
@@ -287,24 +359,25 @@ class VectorSimilarityTest(TestCase):
 class SimilarityServiceTest(TestCase):
     """Test the advanced similarity service functionality."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for similarity service."""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="similarity_test", email="sim@test.com", password="test123"
         )
 
-        self.lang_profile = LanguageProfile.objects.create(
-            user=self.user, target_language='en', current_level='A2'
+        cls.lang_profile = LanguageProfile.objects.create(
+            user=cls.user, target_language='en', current_level='A2'
         )
 
         # Create concept with embedding
-        self.concept = GrammarConcept.objects.create(
+        cls.concept = GrammarConcept.objects.create(
             name="Test Concept",
             description="A test concept for similarity service",
             language='en',
             cefr_level='A2',
             complexity_score=2.0,
-            embedding=[0.1] * 768,
+            embedding=_UNIFORM_01,
         )
 
     def test_concept_difficulty_analysis(self):
@@ -335,7 +408,7 @@ class SimilarityServiceTest(TestCase):
             language='en',
             cefr_level='A2',
             complexity_score=2.1,
-            embedding=[0.12] * 768,  # Similar to self.concept
+            embedding=_UNIFORM_012,  # Similar to self.concept
         )
 
         GrammarConcept.objects.create(
@@ -344,7 +417,7 @@ class SimilarityServiceTest(TestCase):
             language='en',
             cefr_level='B1',
             complexity_score=3.0,
-            embedding=[0.8] * 768,  # Very different from self.concept
+            embedding=_UNIFORM_08,  # Very different from self.concept
         )
 
         # Test basic clustering functionality
@@ -382,18 +455,19 @@ class SimilarityServiceTest(TestCase):
 class MessageProcessingTest(TestCase):
     """Test message processing and language tracking integration."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for message processing."""
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username="message_processor", email="processor@test.com", password="test123"
         )
 
-        self.lang_profile = LanguageProfile.objects.create(
-            user=self.user, target_language='en', current_level='A2', total_messages=0
+        cls.lang_profile = LanguageProfile.objects.create(
+            user=cls.user, target_language='en', current_level='A2', total_messages=0
         )
 
-        self.conversation = Conversation.objects.create(
-            user=self.user, title="Processing Test", language='en'
+        cls.conversation = Conversation.objects.create(
+            user=cls.user, title="Processing Test", language='en'
         )
 
     def test_message_creation_updates_profile(self):
@@ -5,13 +5,16 @@ Views for the chat application that integrates with Gemini API.
 """
 
 from typing import Optional, Callable, TypeVar, Any
+from datetime import timedelta
+import functools
 import random
 import asyncio
 import sys
 
+from django.conf import settings
 from django.contrib.auth.decorators import login_required
 from django.http import JsonResponse
-from django.http import HttpRequest, HttpResponse
+from django.http import HttpRequest, HttpResponse, HttpResponseNotModified
 from django.shortcuts import render, redirect, aget_object_or_404
 from django.urls import reverse
 from django.utils import timezone
@@ -19,15 +22,24 @@ from django.views.decorators.csrf import csrf_protect
 from django_ratelimit.decorators import ratelimit
 from django.views.decorators.http import require_http_methods
 
-from .models import ChatMessage, Conversation, AfterActionReport
+from django.db.models import F
+
+from .models import (
+    ChatMessage,
+    Conversation,
+    AfterActionReport,
+    GrammarAnalysisCache,
+)
 from .ai_service import ai_service
+from .embedding_service import embedding_service
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-# Type variables for view function annotations
-F = TypeVar('F', bound=Callable[..., Any])
+# Type variable for view function annotations. Named ViewFunc (not the
+# conventional F) so it can't shadow django.db.models.F imported above.
+ViewFunc = TypeVar('ViewFunc', bound=Callable[..., Any])
 
 
 def get_session_key(group: str, request: HttpRequest) -> str:
@@ -39,10 +51,10 @@ def get_session_key(group: str, request: HttpRequest) -> str:
 
 def conditional_ratelimit(
     key: str, rate: str, method: str = 'POST'
-) -> Callable[[F], F]:
+) -> Callable[[ViewFunc], ViewFunc]:
     """Apply rate limiting only when not in test mode or when rate limiting is enabled."""
 
-    def decorator(func: F) -> F:
+    def decorator(func: ViewFunc) -> ViewFunc:
         # Check if we're running tests
         if 'test' in sys.argv or hasattr(sys, '_called_from_test'):
             return func  # Skip rate limiting during tests
@@ -62,9 +74,26 @@ def conditional_ratelimit(
     return decorator
 
 
-# Conversation starter prompts - elementary language textbook style
+def reject_empty_message(func: ViewFunc) -> ViewFunc:
+    """Reject POSTs with an empty message before rate limiting runs.
+
+    Placed above the rate-limit decorators so trivially invalid requests
+    are answered without burning cache round-trips or the caller's quota.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(request: HttpRequest, *args: Any, **kwargs: Any) -> Any:
+        if request.method == 'POST' and not request.POST.get('message', '').strip():
+            return JsonResponse({'error': 'Message cannot be empty'}, status=400)
+        return await func(request, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+# Conversation starter prompts - elementary language textbook style.
+# Tuples: the starters are read-only constants, never mutated per request.
 CONVERSATION_STARTERS = {
-    'en': [
+    'en': (
         "Tell me about your family?",
         "What did you do today?",
         "What do you like doing for fun?",
@@ -80,8 +109,8 @@ CONVERSATION_STARTERS = {
         "What's your favorite subject in school?",
         "Tell me about your hometown?",
         "What are your hobbies?",
-    ],
-    'es': [
+    ),
+    'es': (
         "Háblame de tu familia?",
         "¿Qué hiciste hoy?",
         "¿Qué te gusta hacer por diversión?",
@@ -97,8 +126,8 @@ CONVERSATION_STARTERS = {
         "¿Cuál es tu materia favorita en la escuela?",
         "Háblame de tu ciudad natal?",
         "¿Cuáles son tus pasatiempos?",
-    ],
-    'de': [
+    ),
+    'de': (
         "Erzähl mir von deiner Familie?",
         "Was hast du heute gemacht?",
         "Was machst du gerne zum Spaß?",
@@ -114,9 +143,184 @@ CONVERSATION_STARTERS = {
         "Was ist dein Lieblingsfach in der Schule?",
         "Erzähl mir von deiner Heimatstadt?",
         "Was sind deine Hobbys?",
-    ],
+    ),
 }
 
+# English fallback for unknown conversation languages, bound once at import
+# time so the hot path skips a second dict lookup per request.
+DEFAULT_STARTERS = CONVERSATION_STARTERS['en']
+
+# Supported language codes, frozen once instead of rebuilding a dict from
+# Conversation.LANGUAGE_CHOICES on every validation.
+VALID_LANGUAGES = frozenset(code for code, _ in Conversation.LANGUAGE_CHOICES)
+
+# Sentinel id used to resolve one-arg routes once; chosen so its digits
+# cannot collide with the static part of any URL pattern here.
+_ROUTE_PLACEHOLDER = 2147483647
+
+
+@functools.cache
+def _reverse_cached(name: str) -> str:
+    """Resolve a no-argument route once per process."""
+    return reverse(name)
+
+
+@functools.cache
+def _route_template(name: str) -> str:
+    """Resolve a one-int-arg route once and keep it as a format template."""
+    return reverse(name, args=[_ROUTE_PLACEHOLDER]).replace(
+        str(_ROUTE_PLACEHOLDER), '{}'
+    )
+
+
+def _chat_url(conversation_id: int) -> str:
+    """URL of a conversation's chat page without re-running URL resolution."""
+    return _route_template('chat').format(conversation_id)
+
+
+# Newest messages rendered per chat page; a LIMIT keeps a very long
+# history from ballooning the view's memory and render time.
+CHAT_HISTORY_LIMIT = 200
+
+# Newest exchanges forwarded to Gemini as conversation memory. Older turns
+# add latency and token cost without improving replies, so the model only
+# sees a sliding window over the tail of the conversation.
+CHAT_HISTORY_WINDOW = 50
+
+# Bound concurrent grammar analyses: a traffic burst queues on the semaphore
+# instead of piling unbounded in-flight calls onto the Gemini API.
+_grammar_semaphore = asyncio.Semaphore(getattr(settings, 'GRAMMAR_CONCURRENCY', 8))
+
+# Finished analyses wake long-polling status requests via these events so a
+# single request replaces a train of client polls. Keyed by message id:
+# waiters create the entry, the finishing task pops and sets it.
+_grammar_events: dict[int, asyncio.Event] = {}
+
+
+def _signal_grammar_done(message_id: int) -> None:
+    """Wake any long-poll waiting on this message's grammar analysis."""
+    event = _grammar_events.pop(message_id, None)
+    if event is not None:
+        event.set()
+
+
+# Strong references to detached grammar tasks: asyncio only keeps weak
+# ones, so without this set a running analysis could be garbage-collected.
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+def _spawn_grammar_task(message_id: int, *args: Any) -> None:
+    """Run ``analyze_grammar_async`` detached from the current request."""
+    task = asyncio.create_task(analyze_grammar_async(message_id, *args))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _drain_grammar_tasks() -> None:
+    """Wait for all detached grammar analyses to finish (used by tests)."""
+    while _background_tasks:
+        await asyncio.gather(*tuple(_background_tasks))
+
+
+async def _run_grammar_analysis(
+    user_message: str,
+    analysis_language: str = 'en',
+    language_code: str = 'en',
+) -> str:
+    """
+    Cache-aware grammar analysis for a single message.
+
+    Checks the exact-hash fast path, then the semantic (embedding) cache,
+    and only calls Gemini on a miss, storing the result for future hits.
+    Entries older than ``GRAMMAR_CACHE_TTL`` seconds are treated as misses
+    and overwritten on the next successful analysis.
+
+    Returns:
+        The grammar analysis text.
+
+    Raises:
+        AgentRunError: If the Gemini call fails on a cache miss. Nothing is
+            stored in that case, so a transient failure is never replayed
+            from the cache.
+    """
+    ttl = getattr(settings, 'GRAMMAR_CACHE_TTL', 86400)
+    cutoff = timezone.now() - timedelta(seconds=ttl)
+
+    # Exact-hash fast path: byte-identical messages skip the vector lookup
+    prompt_hash = GrammarAnalysisCache.make_prompt_hash(
+        user_message, analysis_language, language_code
+    )
+    cached = await GrammarAnalysisCache.objects.filter(
+        prompt_hash=prompt_hash, created_at__gte=cutoff
+    ).afirst()
+
+    # Semantic lookup: paraphrases of an already-analysed message hit the
+    # cache via pgvector cosine similarity instead of calling Gemini again.
+    query_embedding: Optional[list[float]] = None
+    if cached is None and getattr(settings, 'GRAMMAR_SEMANTIC_CACHE', True):
+        query_embedding = await embedding_service.generate_embedding(
+            user_message, language_code
+        )
+        if query_embedding:
+            candidate = await GrammarAnalysisCache.objects.similarity_search(
+                vector_field='embedding',
+                query_vector=query_embedding,
+                limit=1,
+                threshold=getattr(settings, 'GRAMMAR_CACHE_THRESHOLD', 0.95),
+            ).afirst()
+            # similarity_search can't take extra filters, so verify the
+            # language pair here before trusting the nearest neighbour.
+            if (
+                candidate is not None
+                and candidate.language == language_code
+                and candidate.analysis_language == analysis_language
+                and candidate.created_at >= cutoff
+            ):
+                cached = candidate
+
+    if cached is not None:
+        await GrammarAnalysisCache.objects.filter(pk=cached.pk).aupdate(
+            hits=F('hits') + 1
+        )
+        return cached.analysis
+
+    async with _grammar_semaphore:
+        analysis_text = await ai_service.analyze_grammar(
+            user_message, analysis_language, language_code
+        )
+
+    # Store the result for future hits; aupdate_or_create absorbs the race
+    # when two tasks analyse the same message concurrently and refreshes an
+    # expired entry in place (prompt_hash is unique, so a stale row would
+    # otherwise block the insert forever).
+    await GrammarAnalysisCache.objects.aupdate_or_create(
+        prompt_hash=prompt_hash,
+        defaults={
+            'message_text': user_message,
+            'language': language_code,
+            'analysis_language': analysis_language,
+            'embedding': query_embedding,
+            'analysis': analysis_text,
+            'created_at': timezone.now(),
+        },
+    )
+    return analysis_text
+
+
+async def _grammar_analysis_or_error(
+    user_message: str,
+    analysis_language: str = 'en',
+    language_code: str = 'en',
+) -> str:
+    """Best-effort analysis: failures become the stored failure text."""
+    try:
+        return await _run_grammar_analysis(
+            user_message, analysis_language, language_code
+        )
+    except Exception as exc:  # pragma: no cover – best-effort background task
+        # In production you might log this.
+        return f"Analysis failed: {exc}"
+
 
 async def analyze_grammar_async(
     message_id: int,
@@ -138,24 +342,16 @@ async def analyze_grammar_async(
         user_id: User ID for proficiency tracking (optional for backward compatibility)
     """
     try:
-        # Verify the message exists (will raise if not found)
-        await ChatMessage.objects.aget(pk=message_id)
-
-        # Use basic grammar analysis (same as demo view) to avoid sync ORM issues
-        analysis_text = await ai_service.analyze_grammar(
+        analysis_text = await _grammar_analysis_or_error(
             user_message, analysis_language, language_code
         )
-
-        # Update the message with analysis result
+        # No separate existence check: the single aupdate verifies the row
+        # via its returned count, saving one round-trip per analysis.
         await ChatMessage.objects.filter(pk=message_id).aupdate(
             grammar_analysis=analysis_text
         )
-
-    except Exception as exc:  # pragma: no cover – best-effort background task
-        # In production you might log this.
-        await ChatMessage.objects.filter(pk=message_id).aupdate(
-            grammar_analysis=f"Analysis failed: {exc}"
-        )
+    finally:
+        _signal_grammar_done(message_id)
 
 
 @login_required  # type: ignore
@@ -175,18 +371,39 @@ async def chat_view(
     if conversation_id is None:
         return redirect("new_conversation")
 
-    conversation = await aget_object_or_404(
-        Conversation, pk=conversation_id, user=request.user
+    async def _fetch_recent_messages() -> list[ChatMessage]:
+        # Django templates render synchronously, so the rows must be
+        # materialized here; fetch only the newest CHAT_HISTORY_LIMIT via
+        # SQL LIMIT (newest-first), then flip back to chronological order.
+        # The template only reads the message's own columns, so no join on
+        # conversation is needed — the owning row is fetched separately.
+        recent = ChatMessage.objects.filter(conversation_id=conversation_id)
+        recent = recent.order_by('-created_at')[:CHAT_HISTORY_LIMIT]
+        return [msg async for msg in recent]
+
+    # The ownership check and the message fetch are independent, so run
+    # them concurrently; a 404/permission failure from the lookup
+    # propagates out of gather and the fetched rows are simply discarded.
+    # select_related('user') joins the owner in the same query instead of
+    # a lazy per-access SELECT if the template touches conversation.user.
+    conversation, messages = await asyncio.gather(
+        aget_object_or_404(
+            Conversation.objects.select_related('user'),
+            pk=conversation_id,
+            user=request.user,
+        ),
+        _fetch_recent_messages(),
     )
-    messages = [
-        msg async for msg in conversation.messages.select_related('conversation').all()
-    ]
+    messages.reverse()
 
-    # Select a random conversation starter for new conversations
-    starters = CONVERSATION_STARTERS.get(
-        conversation.language, CONVERSATION_STARTERS['en']
-    )
-    conversation_starter = random.choice(starters)
+    # Select a conversation starter only for brand-new conversations;
+    # the template ignores it as soon as messages exist. Indexing by the
+    # conversation id instead of random.choice skips the shared RNG and
+    # keeps the starter stable across reloads of the same conversation.
+    conversation_starter = None
+    if not messages:
+        starters = CONVERSATION_STARTERS.get(conversation.language, DEFAULT_STARTERS)
+        conversation_starter = starters[conversation.id % len(starters)]
 
     return render(
         request,
@@ -219,19 +436,19 @@ async def new_conversation(request: HttpRequest) -> HttpResponse:
     )
 
     # Validate language choices
-    valid_languages = dict(Conversation.LANGUAGE_CHOICES).keys()
-    if language not in valid_languages:
+    if language not in VALID_LANGUAGES:
         language = 'en'
-    if analysis_language not in valid_languages:
+    if analysis_language not in VALID_LANGUAGES:
         analysis_language = 'en'
 
     convo = await Conversation.objects.acreate(
         user=request.user, language=language, analysis_language=analysis_language
     )
-    return redirect(reverse("chat", args=[convo.id]))
+    return redirect(_chat_url(convo.id))
 
 
 @login_required  # type: ignore
+@reject_empty_message
 @conditional_ratelimit(key='ip', rate='10/h', method='POST')
 @conditional_ratelimit(key='ip', rate='100/d', method='POST')
 @conditional_ratelimit(key='session', rate='5/h', method='POST')
@@ -248,36 +465,53 @@ async def send_message(request: HttpRequest) -> JsonResponse:
     if request.method != 'POST':
         return JsonResponse({'error': 'Only POST requests are allowed'}, status=405)
 
-    # Get the user message and conversation ID from the request
+    # Get the user message and conversation ID from the request; empty
+    # messages were already rejected by @reject_empty_message.
     user_message = request.POST.get('message', '').strip()
     conversation_id = request.POST.get('conversation_id')
 
-    if not user_message:
-        return JsonResponse({'error': 'Message cannot be empty'}, status=400)
-
     if not conversation_id:
         return JsonResponse({'error': 'Conversation ID is required'}, status=400)
 
-    # Look up the conversation
+    # Reject malformed ids before spending a DB round-trip on them
+    try:
+        conversation_pk = int(conversation_id)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid conversation ID'}, status=400)
+
+    # Look up the conversation; only() skips hydrating columns this view
+    # never reads (title, timestamps).
     conversation = await aget_object_or_404(
-        Conversation, pk=conversation_id, user=request.user
+        Conversation.objects.only('id', 'language', 'analysis_language'),
+        pk=conversation_pk,
+        user=request.user,
     )
 
     # ------------------------------------------------------------------
     # 1. Build conversation history for memory
     # ------------------------------------------------------------------
+    # values_list fetches the history in one round-trip without
+    # instantiating a ChatMessage object per row. Selecting the newest
+    # CHAT_HISTORY_WINDOW exchanges (then restoring chronological order)
+    # keeps the query an index-backed LIMIT instead of a full scan.
+    history_rows = [
+        row
+        async for row in conversation.messages.order_by('-created_at').values_list(
+            'message', 'response'
+        )[:CHAT_HISTORY_WINDOW]
+    ]
     conversation_history = []
-    async for msg in conversation.messages.all().order_by('created_at'):
+    for message_text, response_text in reversed(history_rows):
         conversation_history.extend(
             [
-                {'role': 'user', 'content': msg.message},
-                {'role': 'assistant', 'content': msg.response},
+                {'role': 'user', 'content': message_text},
+                {'role': 'assistant', 'content': response_text},
             ]
         )
 
     # ------------------------------------------------------------------
-    # 2. Use Pydantic AI service to generate response with conversation memory
-    # 3. This automatically logs input/output to Logfire for observability
+    # 2. Generate the chat response. Pydantic AI logs input/output to
+    #    Logfire for observability.
     # ------------------------------------------------------------------
 
     try:
@@ -289,26 +523,25 @@ async def send_message(request: HttpRequest) -> JsonResponse:
             {'error': f'Error communicating with AI service: {str(e)}'}, status=500
         )
 
-    # Save the message and response to the database with conversation
+    # --------------------------------------------------------------
+    # Persist the exchange. The conversation's updated_at is bumped by
+    # a Postgres trigger on ChatMessage insert (migration 0016), so the
+    # single INSERT is the only round-trip here.
+    # --------------------------------------------------------------
     chat_message = await ChatMessage.objects.acreate(
-        conversation=conversation, message=user_message, response=ai_response
+        conversation=conversation,
+        message=user_message,
+        response=ai_response,
     )
 
-    # Update the conversation's last updated timestamp
-    conversation.updated_at = timezone.now()
-
-    # --------------------------------------------------------------
-    # Run conversation save and grammar analysis concurrently
-    # This ensures the grammar analysis actually completes
-    # --------------------------------------------------------------
-    await asyncio.gather(
-        conversation.asave(update_fields=['updated_at']),
-        analyze_grammar_async(
-            chat_message.id,
-            user_message,
-            conversation.analysis_language,
-            conversation.language,
-        ),
+    # Detach the grammar analysis so the response doesn't wait on a second
+    # Gemini round-trip; the client already polls check_grammar_status,
+    # which long-polls until analyze_grammar_async stores the result.
+    _spawn_grammar_task(
+        chat_message.id,
+        user_message,
+        conversation.analysis_language,
+        conversation.language,
     )
 
     # Return the response as JSON
@@ -324,23 +557,67 @@ async def send_message(request: HttpRequest) -> JsonResponse:
 
 
 @login_required  # type: ignore
-async def check_grammar_status(request: HttpRequest, message_id: int) -> JsonResponse:
+async def check_grammar_status(request: HttpRequest, message_id: int) -> HttpResponse:
     """
     Return grammar analysis for a given ``ChatMessage``.
 
-    Expected by the front-end polling code.  The endpoint is read-only.
+    Long-polls instead of requiring the client to re-poll: when the
+    analysis isn't ready yet, the request parks on an :class:`asyncio.Event`
+    that ``analyze_grammar_async`` sets on completion, bounded by
+    ``GRAMMAR_POLL_TIMEOUT`` seconds. The event only fires in this process,
+    so the wait runs in ``GRAMMAR_POLL_INTERVAL`` slices with a DB re-read
+    between them — an analysis finished by another worker surfaces on the
+    next slice instead of after the full timeout.
     """
     if request.method != "GET":
         return JsonResponse({"error": "Only GET requests are allowed"}, status=405)
 
     message: ChatMessage = await aget_object_or_404(ChatMessage, pk=message_id)
 
+    if not message.grammar_analysis:
+        # Register the waiter *before* re-checking the DB: a completion
+        # between the fetch above and the wait below would otherwise signal
+        # an empty _grammar_events dict and park this request until the
+        # timeout expired.
+        event = _grammar_events.setdefault(message_id, asyncio.Event())
+        await message.arefresh_from_db(fields=['grammar_analysis'])
+
+        loop = asyncio.get_running_loop()
+        interval = getattr(settings, 'GRAMMAR_POLL_INTERVAL', 2)
+        deadline = loop.time() + getattr(settings, 'GRAMMAR_POLL_TIMEOUT', 25)
+        while not message.grammar_analysis:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                # Not ready within the window; return whatever is in the DB
+                # and let the client issue another long-poll.
+                break
+            try:
+                await asyncio.wait_for(event.wait(), timeout=min(interval, remaining))
+            except TimeoutError:
+                pass
+            await message.arefresh_from_db(fields=['grammar_analysis'])
+            if event.is_set():
+                break
+        _grammar_events.pop(message_id, None)
+
     # Return analysis (may be empty string / None)
-    return JsonResponse(
-        {
-            "grammar_analysis": message.grammar_analysis or "",
-        }
-    )
+    analysis = message.grammar_analysis or ""
+    if analysis:
+        # Once populated the analysis never changes: a weak ETag lets the
+        # browser answer repeat polls with 304s instead of re-reading the
+        # row, and max-age keeps it out of the network entirely for a bit.
+        etag = f'W/"{message_id}:{len(analysis)}"'
+        if request.headers.get("If-None-Match") == etag:
+            not_modified = HttpResponseNotModified()
+            not_modified["ETag"] = etag
+            return not_modified
+
+        response = JsonResponse({"grammar_analysis": analysis})
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, max-age=60, immutable"
+        return response
+
+    return JsonResponse({"grammar_analysis": analysis})
 
 
 # --------------------------------------------------------------------------- #
@@ -369,22 +646,29 @@ async def conversation_analysis(
     # ------------------------------------------------------------------ #
     # 1. Fetch conversation & ensure it has messages                     #
     # ------------------------------------------------------------------ #
+    # latest_report rides along in the conversation fetch, so the common
+    # "report exists" branch costs no extra query at all.
     conversation: Conversation = await aget_object_or_404(
-        Conversation, pk=conversation_id, user=request.user
+        Conversation.objects.select_related('user', 'latest_report'),
+        pk=conversation_id,
+        user=request.user,
     )
-    messages_qs = conversation.messages.all()  # ordering in model.Meta
 
-    # Redirect to chat view when there is nothing to analyse yet.
-    if not await messages_qs.aexists():
-        return redirect(reverse("chat", args=[conversation.id]))
-
-    # ------------------------------------------------------------------ #
-    # 1b. If we've already generated a report, re-use it                 #
-    # ------------------------------------------------------------------ #
-    existing_report: Optional[AfterActionReport] = await conversation.reports.afirst()
+    existing_report: Optional[AfterActionReport] = conversation.latest_report
 
     if existing_report:
-        return render(
+        # Reports are immutable once generated: a weak ETag lets returning
+        # clients revalidate with a 304 instead of re-rendering the page.
+        etag = (
+            f'W/"aar-{existing_report.id}-'
+            f'{int(existing_report.updated_at.timestamp())}"'
+        )
+        if request.headers.get("If-None-Match") == etag:
+            not_modified = HttpResponseNotModified()
+            not_modified["ETag"] = etag
+            return not_modified
+
+        response = render(
             request,
             "chat/analysis.html",
             {
@@ -393,13 +677,23 @@ async def conversation_analysis(
                 "report": existing_report,
             },
         )
+        response["ETag"] = etag
+        return response
 
     # ------------------------------------------------------------------ #
     # 2. Build messages data for analysis                                #
     # ------------------------------------------------------------------ #
-    messages_data = []
-    async for msg in messages_qs:
-        messages_data.append({'message': msg.message, 'feedback': msg.grammar_analysis})
+    # One projected fetch serves both the emptiness check and the prompt.
+    messages_data = [
+        {'message': message_text, 'feedback': feedback}
+        async for message_text, feedback in conversation.messages.values_list(
+            'message', 'grammar_analysis'
+        )
+    ]
+
+    # Redirect to chat view when there is nothing to analyse yet.
+    if not messages_data:
+        return redirect(_chat_url(conversation.id))
 
     # ------------------------------------------------------------------ #
     # 3. Call AI service for conversation analysis                       #
@@ -412,10 +706,15 @@ async def conversation_analysis(
     # ------------------------------------------------------------------ #
     # 4. Persist after-action report                                     #
     # ------------------------------------------------------------------ #
-    report = await AfterActionReport.objects.acreate(
+    # get_or_create plus the unique constraint on conversation means a
+    # concurrent analysis request can't insert a duplicate row; the loser
+    # of the race serves the winner's report.
+    report, created = await AfterActionReport.objects.aget_or_create(
         conversation=conversation,
-        analysis_content=analysis_text,
+        defaults={'analysis_content': analysis_text},
     )
+    if not created:
+        analysis_text = report.analysis_content
 
     # ------------------------------------------------------------------ #
     # 5. Render template                                                 #
@@ -453,7 +752,7 @@ async def end_conversation(
     await conversation.end()
 
     # Redirect to the analysis page which will create the AfterActionReport
-    return redirect(reverse("conversation_analysis", args=[conversation.id]))
+    return redirect(_route_template('conversation_analysis').format(conversation.id))
 
 
 # ---------------------------------------------------------------------------
@@ -484,11 +783,11 @@ async def demo_chat_view(request: HttpRequest) -> HttpResponse:
 
     # If no language provided, redirect to language selection
     if not language:
-        return redirect(reverse('demo_language_selection'))
+        return redirect(_reverse_cached('demo_language_selection'))
 
     # Validate language choices
     if language not in CONVERSATION_STARTERS:
-        return redirect(reverse('demo_language_selection'))
+        return redirect(_reverse_cached('demo_language_selection'))
 
     # Default analysis language to English if not provided
     if not analysis_language or analysis_language not in CONVERSATION_STARTERS:
@@ -560,11 +859,16 @@ async def demo_send_message(request: HttpRequest) -> JsonResponse:
     # ------------------------------------------------------------------
     # 3. Update session with new message and response using Django's async session methods
     # ------------------------------------------------------------------
+    # Persist only the same sliding window the authenticated chat sends to
+    # Gemini, so the session row stops growing with conversation length.
     new_conversation_history = conversation_history + [
         {'role': 'user', 'content': user_message},
         {'role': 'assistant', 'content': ai_response},
     ]
-    await request.session.aset('demo_conversation_history', new_conversation_history)
+    await request.session.aset(
+        'demo_conversation_history',
+        new_conversation_history[-2 * CHAT_HISTORY_WINDOW :],
+    )
 
     # Return the response as JSON
     return JsonResponse(
@@ -1,39 +1,147 @@
-"""Custom cache backend for rate limiting with database storage."""
+"""Custom cache backend for rate limiting with database storage.
 
-from typing import Optional
+Unlike Django's generic ``DatabaseCache`` — which pickles values and needs
+several queries per operation (cull check, existence probe, then an insert
+or update) — this backend only ever stores rate-limit counters. Keeping the
+value column as plain integer text lets PostgreSQL do the arithmetic, so
+``add`` and ``incr`` each collapse into a single round-trip.
+"""
 
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
 from django.core.cache.backends.db import DatabaseCache
-from django.db import transaction
+from django.db import connections, router
+from django.utils.timezone import now as tz_now
 
 
 class RateLimitDatabaseCache(DatabaseCache):
-    """Database cache backend with atomic increment support for rate limiting."""
+    """Database cache backend with atomic increment support for rate limiting.
+
+    Values are stored as integer text rather than pickled blobs, which is
+    safe because django-ratelimit only ever writes counters to this cache.
+    """
+
+    def _connection(self, for_write: bool = False) -> Any:
+        """Return the routed connection for this cache's pseudo-model."""
+        if for_write:
+            db = router.db_for_write(self.cache_model_class)
+        else:
+            db = router.db_for_read(self.cache_model_class)
+        return connections[db]
+
+    def _adapted_now(self, connection: Any) -> Any:
+        """Current time adapted for comparison against the expires column."""
+        now = tz_now().replace(microsecond=0, tzinfo=None)
+        return connection.ops.adapt_datetimefield_value(now)
+
+    def _adapted_expiry(self, connection: Any, timeout: Any) -> Any:
+        """Convert a cache timeout into an adapted expires column value."""
+        backend_timeout = self.get_backend_timeout(timeout)
+        if backend_timeout is None:
+            exp = datetime.max
+        else:
+            tz = timezone.utc if settings.USE_TZ else None
+            exp = datetime.fromtimestamp(backend_timeout, tz=tz)
+        return connection.ops.adapt_datetimefield_value(exp.replace(microsecond=0))
+
+    def get(
+        self, key: str, default: Optional[Any] = None, version: Optional[int] = None
+    ) -> Any:
+        """Fetch a counter with one indexed SELECT on the primary key."""
+        db_key = self.make_and_validate_key(key, version=version)
+        connection = self._connection()
+        quote_name = connection.ops.quote_name
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT %s FROM %s WHERE %s = %%s AND %s > %%s"
+                % (
+                    quote_name("value"),
+                    quote_name(self._table),
+                    quote_name("cache_key"),
+                    quote_name("expires"),
+                ),
+                [db_key, self._adapted_now(connection)],
+            )
+            row = cursor.fetchone()
+
+        return int(row[0]) if row else default
+
+    def add(
+        self,
+        key: str,
+        value: Any,
+        timeout: Any = DEFAULT_TIMEOUT,
+        version: Optional[int] = None,
+    ) -> bool:
+        """Insert a counter unless a live one exists, in one upsert.
+
+        Expired rows for other keys are purged in the same statement via a
+        data-modifying CTE, replacing the base backend's cull machinery.
+        """
+        db_key = self.make_and_validate_key(key, version=version)
+        connection = self._connection(for_write=True)
+        quote_name = connection.ops.quote_name
+        table = quote_name(self._table)
+        now = self._adapted_now(connection)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "WITH purged AS ("
+                "  DELETE FROM %(table)s WHERE %(expires)s <= %%s"
+                ") "
+                "INSERT INTO %(table)s (%(cache_key)s, %(value)s, %(expires)s) "
+                "VALUES (%%s, %%s, %%s) "
+                "ON CONFLICT (%(cache_key)s) DO UPDATE "
+                "SET %(value)s = EXCLUDED.%(value)s, "
+                "    %(expires)s = EXCLUDED.%(expires)s "
+                "WHERE %(table)s.%(expires)s <= %%s"
+                % {
+                    'table': table,
+                    'cache_key': quote_name("cache_key"),
+                    'value': quote_name("value"),
+                    'expires': quote_name("expires"),
+                },
+                [
+                    now,
+                    db_key,
+                    str(int(value)),
+                    self._adapted_expiry(connection, timeout),
+                    now,
+                ],
+            )
+            # rowcount is 1 when the row was inserted or an expired row was
+            # replaced, 0 when a live counter already existed.
+            return cursor.rowcount == 1
 
     def incr(self, key: str, delta: int = 1, version: Optional[int] = None) -> int:
-        """Increment cache value atomically using database transactions."""
-        # Get the raw key (original, not transformed)
-        raw_key = key
-        # Make the key for database storage
-        db_key = self.make_key(key, version=version)
-        self.validate_key(db_key)
-
-        with transaction.atomic():
-            try:
-                # Try to get the current value using raw API
-                current_value = super().get(raw_key, version=version)
-                if current_value is None:
-                    # Key doesn't exist, set it to delta
-                    super().set(raw_key, delta, version=version)
-                    return delta
-                else:
-                    # Key exists, increment it
-                    new_value = int(current_value) + delta
-                    super().set(raw_key, new_value, version=version)
-                    return new_value
-            except (ValueError, TypeError):
-                # Value is not an integer, set it to delta
-                super().set(raw_key, delta, version=version)
-                return delta
+        """Increment a live counter with a single UPDATE … RETURNING."""
+        db_key = self.make_and_validate_key(key, version=version)
+        connection = self._connection(for_write=True)
+        quote_name = connection.ops.quote_name
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "UPDATE %s SET %s = (CAST(%s AS bigint) + %%s)::text "
+                "WHERE %s = %%s AND %s > %%s RETURNING %s"
+                % (
+                    quote_name(self._table),
+                    quote_name("value"),
+                    quote_name("value"),
+                    quote_name("cache_key"),
+                    quote_name("expires"),
+                    quote_name("value"),
+                ),
+                [delta, db_key, self._adapted_now(connection)],
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            raise ValueError("Key '%s' not found" % key)
+        return int(row[0])
 
     def decr(self, key: str, delta: int = 1, version: Optional[int] = None) -> int:
         """Decrement cache value atomically."""
@@ -108,6 +108,10 @@ if os.getenv('DATABASE_URL'):
             conn_health_checks=True,
         )
     }
+    # Let psycopg prepare statements server-side once a query repeats, so
+    # hot single-row writes (e.g. grammar-analysis updates) skip re-parsing
+    # and re-planning. Django leaves this off by default.
+    DATABASES['default'].setdefault('OPTIONS', {})['prepare_threshold'] = 5
 else:
     # Local development PostgreSQL - required
     postgres_db = os.getenv('POSTGRES_DB')
@@ -136,7 +140,17 @@ else:
             'PASSWORD': postgres_password,
             'HOST': postgres_host,
             'PORT': postgres_port,
-            'CONN_MAX_AGE': 0,  # Disable persistent connections for async
+            'CONN_MAX_AGE': 0,  # Pooling below replaces persistent connections
+            'OPTIONS': {
+                # Server-side prepared statements for repeated queries (see
+                # the DATABASE_URL branch above).
+                'prepare_threshold': 5,
+                # psycopg's built-in pool: async views grab warm sockets
+                # instead of paying connect + auth on every request. Only
+                # valid with CONN_MAX_AGE = 0, so the Heroku branch (which
+                # uses conn_max_age=600 persistent connections) skips it.
+                'pool': {'min_size': 2, 'max_size': 10},
+            },
         }
     }
 
@@ -159,6 +173,17 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+]
+
+# In development only, append MD5 so the server can verify the throwaway
+# Playwright test user, whose password is hashed with MD5 to skip ~300ms
+# of PBKDF2 work per test run. Production keeps the PBKDF2-only chain.
+if DEBUG:
+    PASSWORD_HASHERS.append('django.contrib.auth.hashers.MD5PasswordHasher')
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
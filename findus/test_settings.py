@@ -5,8 +5,19 @@ This module provides default values for environment variables that are required
 in the main settings but may not be available in CI/test environments.
 """
 
+import asyncio
 import os
 
+# Run async tests on uvloop: its C-implemented selector cuts per-await
+# overhead for the many short event-loop hops AsyncClient tests make.
+# Falls back to the default loop where uvloop has no wheel (e.g. Windows).
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
 # Set dummy environment variables for testing if not already set
 if not os.getenv('GEMINI_API_KEY'):
     os.environ['GEMINI_API_KEY'] = 'test-dummy-key-12345'
@@ -30,9 +41,23 @@ DATABASES = {
         'HOST': os.getenv('POSTGRES_HOST', 'localhost'),
         'PORT': os.getenv('POSTGRES_PORT', '5432'),
         'CONN_MAX_AGE': 0,  # No persistent connections
-        'OPTIONS': {},
+        # Tests don't need durability: skip the WAL flush on every commit so
+        # TransactionTestCase TRUNCATE/INSERT cycles aren't bound by disk syncs.
+        'OPTIONS': {
+            'options': '-c synchronous_commit=off',
+            # Same server-side prepared statements as production settings
+            'prepare_threshold': 5,
+        },
         'TEST': {
             'NAME': None,  # Use default test database name
         },
     }
 }
+
+# The semantic grammar cache needs real Gemini embeddings for its vector
+# lookups; unit tests must stay offline, so only the exact-hash path runs.
+GRAMMAR_SEMANTIC_CACHE = False
+
+# Status requests answer immediately in tests instead of long-polling for
+# an analysis that nothing will produce.
+GRAMMAR_POLL_TIMEOUT = 0